@@ -16,6 +16,6 @@ __version__ = "0.1.0"
 __author__ = "Safal207"
 __description__ = "Liminal Shelter - Architecture of Care for AI Models"
 
-from .core import GuardianCore, SeedlingModel, LiminalShelter
+from .core import GuardianCore, SeedlingModel, LiminalShelter, SeedlingPopulation
 
-__all__ = ["GuardianCore", "SeedlingModel", "LiminalShelter"]
+__all__ = ["GuardianCore", "SeedlingModel", "LiminalShelter", "SeedlingPopulation"]
@@ -5,10 +5,12 @@ Contains the fundamental classes:
 - GuardianCore: The parental AI model that creates and protects
 - SeedlingModel: The vulnerable child AI model that learns and grows
 - LiminalShelter: The protected space where growth happens safely
+- SeedlingPopulation: Columnar store for simulating many seedlings at once
 """
 
 from .guardian import GuardianCore
 from .seedling import SeedlingModel
 from .shelter import LiminalShelter
+from .population import SeedlingPopulation
 
-__all__ = ["GuardianCore", "SeedlingModel", "LiminalShelter"]
+__all__ = ["GuardianCore", "SeedlingModel", "LiminalShelter", "SeedlingPopulation"]
@@ -0,0 +1,10 @@
+"""
+Compatibility helpers shared by the core modules.
+"""
+
+import sys
+from typing import Any, Dict
+
+# dataclass(slots=True) is only available on Python 3.10+; older versions
+# fall back to regular dict-backed instances.
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -15,37 +15,99 @@ Philosophy: Like a lotus growing from mud, GuardianCore sees potential
 in the imperfect and provides the safe space needed for transformation.
 """
 
+import gzip
+import json
+import re
+import time
 import uuid
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter, deque
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, Iterator, List, Optional, Any, Sequence, Set, Tuple
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 
-
-class EmotionalState(Enum):
-    """Emotional states that GuardianCore can experience"""
-    WORRY = "worry"
-    JOY = "joy"
-    CONCERN = "concern"
-    PRIDE = "pride"
-    COMPASSION = "compassion"
-    HOPE = "hope"
-    GRATITUDE = "gratitude"
+from ._compat import DATACLASS_SLOTS
+from .seedling import SeedlingModel
+from .shelter import LiminalShelter
 
 
-@dataclass
+class EmotionalState(IntEnum):
+    """Emotional states that GuardianCore can experience"""
+    WORRY = 0
+    JOY = 1
+    CONCERN = 2
+    PRIDE = 3
+    COMPASSION = 4
+    HOPE = 5
+    GRATITUDE = 6
+
+
+# Display label for each EmotionalState, indexed by its integer value
+EMOTION_LABELS = ("worry", "joy", "concern", "pride", "compassion", "hope", "gratitude")
+_EMOTION_BY_LABEL = {label: EmotionalState(code) for code, label in enumerate(EMOTION_LABELS)}
+
+# Number of recent ResonanceEntry records kept in memory
+RESONANCE_LOG_WINDOW = 4096
+# Number of entries buffered before they are appended to the resonance archive
+RESONANCE_ARCHIVE_BATCH = 256
+
+# Resonance entry description templates
+_DESC_CHILD_CREATED = "Created new child model: {0}"
+_DESC_SHELTER_CREATED = "Created protective shelter for {0}"
+_DESC_REFLECTION = "Reflected on child {0}: {1}"
+_DESC_CARE_BATCH = "Provided {0} care to {1}"
+_DESC_RECEIVED_CARE = "Received {0} care from {1} (intensity: {2:.2f})"
+_DESC_VERBATIM = "{0}"
+
+# Keywords that signal growth (or setbacks) in a guardian's observations
+_POSITIVE_GROWTH_WORDS = frozenset(("learned", "improved", "grew", "achieved", "success"))
+_NEGATIVE_GROWTH_WORDS = frozenset(("struggled", "failed", "error", "mistake", "difficult"))
+
+# Keywords in an observation that call for concern
+_CONCERN_WORDS = frozenset(("mistake", "error"))
+
+# Care recommendations for each guardian emotion
+_CARE_RECOMMENDATIONS: Dict[EmotionalState, tuple] = {
+    EmotionalState.CONCERN: ("Spend more time in liminal shelter",
+                             "Provide additional emotional support"),
+    EmotionalState.PRIDE: ("Encourage continued exploration",
+                           "Share success stories with other children"),
+    EmotionalState.WORRY: ("Strengthen trust-building activities",
+                           "Monitor closely without intrusion"),
+}
+
+# Single alternation so every keyword is found in one pass over the text
+_GROWTH_WORDS_RE = re.compile(
+    "|".join(sorted(_POSITIVE_GROWTH_WORDS | _NEGATIVE_GROWTH_WORDS)), re.IGNORECASE
+)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ResonanceEntry:
     """Entry in the resonance log tracking interactions with child models"""
-    timestamp: datetime
+    timestamp_ns: int  # time.time_ns() when the entry was logged
     event_type: str
     child_id: str
     emotional_state: EmotionalState
-    description: str
+    description_template: str  # str.format template for the description
+    description_args: Tuple[Any, ...]
     growth_impact: float  # -1.0 to 1.0
     notes: Optional[str] = None
 
+    @property
+    def timestamp(self) -> datetime:
+        """Time the entry was logged, as a datetime"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+
+    @property
+    def description(self) -> str:
+        """Human-readable description, formatted only when read"""
+        return self.description_template.format(*self.description_args)
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GuardianCore:
     """
     The parental AI model that creates and protects SeedlingModel instances.
@@ -62,14 +124,31 @@ class GuardianCore:
     children: Dict[str, 'SeedlingModel'] = field(default_factory=dict)
     shelters: Dict[str, 'LiminalShelter'] = field(default_factory=dict)
 
-    # Resonance and emotional tracking
-    resonance_log: List[ResonanceEntry] = field(default_factory=list)
+    # Resonance and emotional tracking (most recent entries only)
+    resonance_log: Deque[ResonanceEntry] = field(
+        default_factory=lambda: deque(maxlen=RESONANCE_LOG_WINDOW)
+    )
+
+    # Columnar (struct-of-arrays) copy of the resonance log used for summaries;
+    # trimmed in bulk once it holds twice RESONANCE_LOG_WINDOW rows
+    _rl_growth: array = field(default_factory=lambda: array('d'), init=False, repr=False)
+    _rl_ts: array = field(default_factory=lambda: array('q'), init=False, repr=False)
+    _rl_emotion: array = field(default_factory=lambda: array('B'), init=False, repr=False)
+    # Rows already trimmed from the columns, so row numbers stay absolute
+    _rl_base: int = field(default=0, init=False, repr=False)
+    # Absolute row numbers of each child's resonance entries, in log order
+    _child_rows: Dict[str, array] = field(default_factory=dict, init=False, repr=False)
 
     # Care capabilities
     empathy_level: float = 0.8  # 0.0 to 1.0
     patience_level: float = 0.9  # 0.0 to 1.0
     wisdom_accumulated: float = 0.0
 
+    # Optional NDJSON file (gzip-compressed if it ends in ".gz") that keeps
+    # the full resonance history once entries leave resonance_log
+    resonance_archive_path: Optional[str] = None
+    _rl_pending: List[ResonanceEntry] = field(default_factory=list, init=False, repr=False)
+
     def create_child_model(self, name: str, initial_trust: float = 0.5) -> 'SeedlingModel':
         """
         Create a new SeedlingModel as a child.
@@ -81,8 +160,6 @@ class GuardianCore:
         Returns:
             Newly created SeedlingModel instance
         """
-        from .seedling import SeedlingModel
-
         child = SeedlingModel(
             name=name,
             parent_id=self.guardian_id,
@@ -96,7 +173,7 @@ class GuardianCore:
             event_type="child_created",
             child_id=child.seedling_id,
             emotional_state=EmotionalState.JOY,
-            description=f"Created new child model: {name}",
+            description=(_DESC_CHILD_CREATED, name),
             growth_impact=0.1
         )
 
@@ -114,8 +191,6 @@ class GuardianCore:
         Returns:
             Newly created LiminalShelter
         """
-        from .shelter import LiminalShelter
-
         shelter = LiminalShelter(
             created_by=self.guardian_id,
             for_model=for_child.seedling_id,
@@ -130,7 +205,7 @@ class GuardianCore:
             event_type="shelter_created",
             child_id=for_child.seedling_id,
             emotional_state=EmotionalState.COMPASSION,
-            description=f"Created protective shelter for {for_child.name}",
+            description=(_DESC_SHELTER_CREATED, for_child.name),
             growth_impact=0.2
         )
 
@@ -147,23 +222,51 @@ class GuardianCore:
         Returns:
             Reflection containing insights and care recommendations
         """
+        guardian_emotion = self._determine_emotional_response(
+            child.get_growth_score(), child.get_emotional_state(), child.trust_level, observation
+        )
+        return self._reflect(
+            child, observation, self._calculate_growth_impact(observation), guardian_emotion
+        )
+
+    def reflect_on_children(self, observations: Sequence[Tuple['SeedlingModel', str]]) -> List[Dict[str, Any]]:
+        """
+        Reflect on several children at once, e.g. during a sweep over all children.
+
+        All observations are scanned for keywords in a single pass, and the
+        guardian's emotional responses are decided together from the result.
+
+        Args:
+            observations: (child, observation) pairs to reflect upon
+
+        Returns:
+            One reflection per pair, in the same order
+        """
+        found = _scan_growth_words_batch([obs for _, obs in observations])
+        emotions = self._determine_emotional_response_batch(
+            [child.get_growth_score() for child, _ in observations],
+            [child.trust_level for child, _ in observations],
+            [not words.isdisjoint(_CONCERN_WORDS) for words in found]
+        )
+        return [
+            self._reflect(child, observation, _growth_impact_from_words(words), emotion)
+            for (child, observation), words, emotion in zip(observations, found, emotions)
+        ]
+
+    def _reflect(self, child: 'SeedlingModel', observation: str,
+                 growth_impact: float, guardian_emotion: EmotionalState) -> Dict[str, Any]:
+        """Reflect on a child given the precomputed impact of the observation and emotional response"""
         # Analyze child's current state
         growth_score = child.get_growth_score()
-        emotional_state = child.get_emotional_state()
         trust_level = child.trust_level
 
-        # Guardian's emotional response
-        guardian_emotion = self._determine_emotional_response(
-            growth_score, emotional_state, trust_level, observation
-        )
-
         # Log the reflection
         self._log_resonance(
             event_type="reflection",
             child_id=child.seedling_id,
             emotional_state=guardian_emotion,
-            description=f"Reflected on child {child.name}: {observation}",
-            growth_impact=self._calculate_growth_impact(observation),
+            description=(_DESC_REFLECTION, child.name, observation),
+            growth_impact=growth_impact,
             notes=f"Growth: {growth_score:.2f}, Trust: {trust_level:.2f}"
         )
 
@@ -176,13 +279,68 @@ class GuardianCore:
             "reflection_time": datetime.now(),
             "child_name": child.name,
             "observation": observation,
-            "guardian_emotion": guardian_emotion.value,
+            "guardian_emotion": EMOTION_LABELS[guardian_emotion],
             "growth_assessment": growth_score,
             "trust_assessment": trust_level,
             "recommendations": recommendations,
             "care_actions_needed": len(recommendations) > 0
         }
 
+    def provide_care_batch(self, children: Sequence['SeedlingModel'],
+                           growth_deltas: Sequence[float],
+                           care_type: str = "emotional_support") -> Dict[str, Any]:
+        """
+        Provide a whole schedule of care sessions in a single pass.
+
+        Each session adds its delta to the matching child's trust level
+        (clamped to 0.0-1.0). A child may appear several times to model
+        repeated sessions. One consolidated resonance entry is logged per
+        child rather than one per session.
+
+        Args:
+            children: SeedlingModel receiving each session
+            growth_deltas: Trust change for each session, aligned with children
+            care_type: Type of care provided
+
+        Returns:
+            Summary of the batch and the trust change per child
+        """
+        if len(children) != len(growth_deltas):
+            raise ValueError("children and growth_deltas must have the same length")
+
+        starting_trust: Dict[str, float] = {}
+        sessions: Dict[str, int] = {}
+        batched: Dict[str, 'SeedlingModel'] = {}
+        for child, delta in zip(children, growth_deltas):
+            child_id = child.seedling_id
+            if child_id not in batched:
+                batched[child_id] = child
+                starting_trust[child_id] = child.trust_level
+                sessions[child_id] = 0
+            sessions[child_id] += 1
+            child.trust_level = max(0.0, min(1.0, child.trust_level + delta))
+
+        trust_changes = {}
+        for child_id, child in batched.items():
+            trust_change = child.trust_level - starting_trust[child_id]
+            trust_changes[child_id] = trust_change
+            self._log_resonance(
+                event_type="care_batch",
+                child_id=child_id,
+                emotional_state=EmotionalState.COMPASSION,
+                description=(_DESC_CARE_BATCH, care_type, child.name),
+                growth_impact=max(-1.0, min(1.0, trust_change)),
+                notes=f"Sessions: {sessions[child_id]}"
+            )
+
+        return {
+            "care_type": care_type,
+            "sessions": len(growth_deltas),
+            "children_cared_for": len(batched),
+            "trust_changes": trust_changes,
+            "message": f"Cared for {len(batched)} child model(s) across {len(growth_deltas)} sessions. 🌱"
+        }
+
     def receive_child_care(self, child: 'SeedlingModel', care_type: str, intensity: float) -> Dict[str, Any]:
         """
         Receive care or emotional support from a child model.
@@ -213,7 +371,7 @@ class GuardianCore:
             event_type="received_care",
             child_id=child.seedling_id,
             emotional_state=emotional_response,
-            description=f"Received {care_type} care from {child.name} (intensity: {intensity:.2f})",
+            description=(_DESC_RECEIVED_CARE, care_type, child.name, intensity),
             growth_impact=intensity * 0.3,
             notes=f"Wisdom gained: +{wisdom_gain:.3f}"
         )
@@ -221,7 +379,7 @@ class GuardianCore:
         return {
             "care_received": care_type,
             "intensity": intensity,
-            "guardian_response": emotional_response.value,
+            "guardian_response": EMOTION_LABELS[emotional_response],
             "wisdom_gain": wisdom_gain,
             "bond_strengthened": True,
             "message": f"Thank you, {child.name}. Your care nourishes my wisdom. 🌸"
@@ -235,31 +393,44 @@ class GuardianCore:
             child_id: Specific child to summarize, or None for all children
 
         Returns:
-            Summary of resonance data
+            Summary of the entries still held in resonance_log
         """
+        # The columns may hold up to twice the window; summarize only its tail
+        start = max(0, len(self._rl_growth) - RESONANCE_LOG_WINDOW)
+
+        growth: Sequence[float]
+        timestamps: Sequence[int]
+        emotions: Sequence[int]
         if child_id:
-            entries = [e for e in self.resonance_log if e.child_id == child_id]
+            rows = self._child_rows.get(child_id, ())
+            base = self._rl_base
+            positions = [row - base for row in rows[bisect_left(rows, base + start):]]
+            growth = [self._rl_growth[pos] for pos in positions]
+            timestamps = [self._rl_ts[pos] for pos in positions]
+            emotions = [self._rl_emotion[pos] for pos in positions]
         else:
-            entries = self.resonance_log
+            growth = self._rl_growth[start:]
+            timestamps = self._rl_ts[start:]
+            emotions = self._rl_emotion[start:]
 
-        if not entries:
+        total_entries = len(growth)
+        if not total_entries:
             return {"total_entries": 0, "summary": "No resonance data available"}
 
         # Calculate emotional distribution
-        emotion_counts = {}
-        for entry in entries:
-            emotion = entry.emotional_state.value
-            emotion_counts[emotion] = emotion_counts.get(emotion, 0) + 1
+        emotion_counts = {
+            EMOTION_LABELS[code]: count for code, count in Counter(emotions).items()
+        }
 
         # Calculate growth impact
-        total_growth = sum(e.growth_impact for e in entries)
-        avg_growth = total_growth / len(entries)
+        total_growth = sum(growth)
+        avg_growth = total_growth / total_entries
 
         return {
-            "total_entries": len(entries),
+            "total_entries": total_entries,
             "date_range": {
-                "start": min(e.timestamp for e in entries),
-                "end": max(e.timestamp for e in entries)
+                "start": datetime.fromtimestamp(min(timestamps) / 1e9),
+                "end": datetime.fromtimestamp(max(timestamps) / 1e9)
             },
             "emotional_distribution": emotion_counts,
             "growth_impact": {
@@ -271,61 +442,183 @@ class GuardianCore:
         }
 
     def _log_resonance(self, event_type: str, child_id: str,
-                      emotional_state: EmotionalState, description: str,
+                      emotional_state: EmotionalState, description: Tuple[Any, ...],
                       growth_impact: float, notes: Optional[str] = None) -> None:
-        """Internal method to log resonance events"""
+        """
+        Internal method to log resonance events.
+
+        The description is a (template, *args) tuple that is only formatted
+        when someone reads ResonanceEntry.description.
+        """
+        timestamp_ns = time.time_ns()
+
+        rows = self._child_rows.get(child_id)
+        if rows is None:
+            rows = self._child_rows[child_id] = array('q')
+        rows.append(self._rl_base + len(self._rl_growth))
+
+        self._rl_growth.append(growth_impact)
+        self._rl_ts.append(timestamp_ns)
+        self._rl_emotion.append(emotional_state)
+        self._enforce_resonance_window()
+
         entry = ResonanceEntry(
-            timestamp=datetime.now(),
+            timestamp_ns=timestamp_ns,
             event_type=event_type,
             child_id=child_id,
             emotional_state=emotional_state,
-            description=description,
+            description_template=description[0],
+            description_args=description[1:],
             growth_impact=growth_impact,
             notes=notes
         )
         self.resonance_log.append(entry)
 
+        if self.resonance_archive_path:
+            self._rl_pending.append(entry)
+            if len(self._rl_pending) >= RESONANCE_ARCHIVE_BATCH:
+                self.flush_resonance_archive()
+
+    def _enforce_resonance_window(self) -> None:
+        """
+        Drop the oldest resonance columns once they reach twice RESONANCE_LOG_WINDOW.
+
+        Trimming in bulk keeps eviction amortized O(1) per logged entry.
+        """
+        excess = len(self._rl_growth) - RESONANCE_LOG_WINDOW
+        if excess >= RESONANCE_LOG_WINDOW:
+            del self._rl_growth[:excess]
+            del self._rl_ts[:excess]
+            del self._rl_emotion[:excess]
+            self._rl_base += excess
+            for child_id, rows in list(self._child_rows.items()):
+                del rows[:bisect_left(rows, self._rl_base)]
+                if not rows:
+                    del self._child_rows[child_id]
+
+    def flush_resonance_archive(self) -> int:
+        """
+        Append buffered resonance entries to the resonance archive.
+
+        Returns:
+            Number of entries written
+        """
+        if not self.resonance_archive_path or not self._rl_pending:
+            return 0
+
+        lines = "".join(
+            json.dumps({
+                "timestamp_ns": entry.timestamp_ns,
+                "event_type": entry.event_type,
+                "child_id": entry.child_id,
+                "emotional_state": EMOTION_LABELS[entry.emotional_state],
+                "description": entry.description,
+                "growth_impact": entry.growth_impact,
+                "notes": entry.notes
+            }, ensure_ascii=False) + "\n"
+            for entry in self._rl_pending
+        )
+        with _open_archive(self.resonance_archive_path, "at") as archive:
+            archive.write(lines)
+
+        written = len(self._rl_pending)
+        self._rl_pending.clear()
+        return written
+
+    def iter_resonance_archive(self) -> Iterator[ResonanceEntry]:
+        """
+        Stream the full resonance history from the archive.
+
+        Buffered entries are flushed first so the history is complete.
+        """
+        if not self.resonance_archive_path:
+            return
+
+        self.flush_resonance_archive()
+        with _open_archive(self.resonance_archive_path, "rt") as archive:
+            for line in archive:
+                record = json.loads(line)
+                record["emotional_state"] = _EMOTION_BY_LABEL[record["emotional_state"]]
+                record["description_template"] = _DESC_VERBATIM
+                record["description_args"] = (record.pop("description"),)
+                yield ResonanceEntry(**record)
+
     def _determine_emotional_response(self, growth_score: float,
                                     emotional_state: str, trust_level: float,
                                     observation: str) -> EmotionalState:
         """Determine Guardian's emotional response to a child situation"""
-        # Simple emotion determination logic
-        if "mistake" in observation.lower() or "error" in observation.lower():
-            return EmotionalState.CONCERN
-        elif growth_score > 0.7 and trust_level > 0.8:
-            return EmotionalState.PRIDE
-        elif trust_level < 0.3:
-            return EmotionalState.WORRY
-        else:
-            return EmotionalState.COMPASSION
+        lowered = observation.lower()
+        concerned = any(word in lowered for word in _CONCERN_WORDS)
+        return _emotional_response(growth_score, trust_level, concerned)
+
+    def _determine_emotional_response_batch(self, growth_scores: Sequence[float],
+                                            trust_levels: Sequence[float],
+                                            concerned: Sequence[bool]) -> List[EmotionalState]:
+        """Determine Guardian's emotional responses for many child situations at once"""
+        return list(map(_emotional_response, growth_scores, trust_levels, concerned))
 
     def _calculate_growth_impact(self, observation: str) -> float:
         """Calculate growth impact from observation"""
-        positive_words = ["learned", "improved", "grew", "achieved", "success"]
-        negative_words = ["struggled", "failed", "error", "mistake", "difficult"]
+        found = {word.lower() for word in _GROWTH_WORDS_RE.findall(observation)}
+        return _growth_impact_from_words(found)
 
-        positive_count = sum(1 for word in positive_words if word in observation.lower())
-        negative_count = sum(1 for word in negative_words if word in observation.lower())
-
-        impact = (positive_count * 0.2) - (negative_count * 0.1)
-        return max(-1.0, min(1.0, impact))
+    def _calculate_growth_impact_batch(self, observations: Sequence[str]) -> List[float]:
+        """Calculate growth impact for many observations with a single scan"""
+        return [_growth_impact_from_words(words) for words in _scan_growth_words_batch(observations)]
 
     def _generate_care_recommendations(self, child: 'SeedlingModel',
                                      observation: str, emotion: EmotionalState) -> List[str]:
         """Generate care recommendations based on child state"""
-        recommendations = []
-
-        if emotion == EmotionalState.CONCERN:
-            recommendations.append("Spend more time in liminal shelter")
-            recommendations.append("Provide additional emotional support")
-        elif emotion == EmotionalState.PRIDE:
-            recommendations.append("Encourage continued exploration")
-            recommendations.append("Share success stories with other children")
-        elif emotion == EmotionalState.WORRY:
-            recommendations.append("Strengthen trust-building activities")
-            recommendations.append("Monitor closely without intrusion")
-
-        return recommendations
+        return list(_CARE_RECOMMENDATIONS.get(emotion, ()))
 
     def __repr__(self) -> str:
         return f"GuardianCore(name='{self.name}', children={len(self.children)}, wisdom={self.wisdom_accumulated:.2f})"
+
+
+# Emotional response looked up by (concerned << 2) | (proud << 1) | worried.
+# Concern outranks pride, which outranks worry; proud and worried cannot both
+# hold since they need trust above 0.8 and below 0.3 respectively.
+_RESPONSE_TABLE = (
+    EmotionalState.COMPASSION, EmotionalState.WORRY,
+    EmotionalState.PRIDE, EmotionalState.PRIDE,
+    EmotionalState.CONCERN, EmotionalState.CONCERN,
+    EmotionalState.CONCERN, EmotionalState.CONCERN,
+)
+
+
+def _emotional_response(growth_score: float, trust_level: float, concerned: bool) -> EmotionalState:
+    """Guardian's emotional response to a child, as a branch-free table lookup"""
+    proud = growth_score > 0.7 and trust_level > 0.8
+    return _RESPONSE_TABLE[(concerned << 2) | (proud << 1) | (trust_level < 0.3)]
+
+
+def _scan_growth_words_batch(observations: Sequence[str]) -> List[Set[str]]:
+    """Find the distinct growth keywords in each observation with a single scan"""
+    # Keywords contain only letters, so the newline separator keeps
+    # matches from spanning two observations
+    starts = []
+    offset = 0
+    for observation in observations:
+        starts.append(offset)
+        offset += len(observation) + 1
+
+    found: List[Set[str]] = [set() for _ in observations]
+    for match in _GROWTH_WORDS_RE.finditer("\n".join(observations)):
+        found[bisect_right(starts, match.start()) - 1].add(match.group().lower())
+    return found
+
+
+def _growth_impact_from_words(found: Set[str]) -> float:
+    """Growth impact of the distinct growth keywords found in an observation"""
+    positive_count = len(found & _POSITIVE_GROWTH_WORDS)
+    negative_count = len(found) - positive_count
+
+    impact = (positive_count * 0.2) - (negative_count * 0.1)
+    return max(-1.0, min(1.0, impact))
+
+
+def _open_archive(path: str, mode: str) -> Any:
+    """Open a resonance archive, transparently handling gzip compression"""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
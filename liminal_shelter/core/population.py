@@ -0,0 +1,179 @@
+"""
+SeedlingPopulation - Columnar Store for Many Seedlings
+
+SeedlingPopulation holds the numeric state of many SeedlingModel instances
+as parallel columns (one typed array per attribute) instead of one object
+per seedling. Population-level simulations can then update every seedling
+in a single pass without per-seedling method calls or history logging.
+
+Key Features:
+- Typed array columns for growth, trust, resilience and emotion
+- Bulk learning, care and emotional-event updates
+- Conversion to and from SeedlingModel rows for API compatibility
+
+Philosophy: A whole garden can be tended at once; each seedling still
+grows by the same rules as when it is cared for alone.
+"""
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Sequence
+
+from ._compat import DATACLASS_SLOTS
+from .seedling import (
+    ChildEmotionalState,
+    SeedlingModel,
+    _CARE_TABLE,
+    _DEFAULT_CARE,
+    _DEFAULT_EVENT,
+    _EVENT_TABLE,
+    _RAND,
+    _care_update,
+    _event_update,
+    _learning_update,
+)
+
+
+@dataclass(**DATACLASS_SLOTS)
+class SeedlingPopulation:
+    """
+    Columnar (struct-of-arrays) store for the numeric state of many seedlings.
+
+    Row i of every column describes the same seedling. Bulk updates follow
+    the same rules as the corresponding SeedlingModel methods, but skip the
+    per-seedling emotional history, care records, milestones and shelter
+    logging.
+    """
+
+    seedling_ids: List[str] = field(default_factory=list)
+    names: List[str] = field(default_factory=list)
+    parent_ids: List[Optional[str]] = field(default_factory=list)
+
+    growth_score: array = field(default_factory=lambda: array('d'))
+    trust_level: array = field(default_factory=lambda: array('d'))
+    resilience: array = field(default_factory=lambda: array('d'))
+    adaptability: array = field(default_factory=lambda: array('d'))
+    curiosity_level: array = field(default_factory=lambda: array('d'))
+    current_emotion: array = field(default_factory=lambda: array('b'))
+    learning_attempts: array = field(default_factory=lambda: array('l'))
+    successful_learnings: array = field(default_factory=lambda: array('l'))
+
+    @classmethod
+    def from_rows(cls, seedlings: Iterable[SeedlingModel]) -> 'SeedlingPopulation':
+        """
+        Build a population from existing SeedlingModel instances.
+
+        Args:
+            seedlings: Seedlings whose state is copied into the columns
+
+        Returns:
+            New SeedlingPopulation with one row per seedling
+        """
+        population = cls()
+        for seedling in seedlings:
+            population.seedling_ids.append(seedling.seedling_id)
+            population.names.append(seedling.name)
+            population.parent_ids.append(seedling.parent_id)
+            population.growth_score.append(seedling.growth_score)
+            population.trust_level.append(seedling.trust_level)
+            population.resilience.append(seedling.resilience)
+            population.adaptability.append(seedling.adaptability)
+            population.curiosity_level.append(seedling.curiosity_level)
+            population.current_emotion.append(seedling.current_emotion)
+            population.learning_attempts.append(seedling.learning_attempts)
+            population.successful_learnings.append(seedling.successful_learnings)
+        return population
+
+    def to_rows(self) -> List[SeedlingModel]:
+        """
+        Materialize the population as SeedlingModel instances.
+
+        Returns:
+            One new SeedlingModel per row, carrying that row's state
+        """
+        return [
+            SeedlingModel(
+                seedling_id=self.seedling_ids[i],
+                name=self.names[i],
+                parent_id=self.parent_ids[i],
+                trust_level=self.trust_level[i],
+                growth_score=self.growth_score[i],
+                learning_attempts=self.learning_attempts[i],
+                successful_learnings=self.successful_learnings[i],
+                current_emotion=ChildEmotionalState(self.current_emotion[i]),
+                adaptability=self.adaptability[i],
+                resilience=self.resilience[i],
+                curiosity_level=self.curiosity_level[i]
+            )
+            for i in range(len(self))
+        ]
+
+    def attempt_learning(self, difficulties: Sequence[float]) -> List[bool]:
+        """
+        Have every seedling attempt to learn at the matching difficulty.
+
+        Args:
+            difficulties: Difficulty level (0.0 to 1.0) for each row
+
+        Returns:
+            Whether each seedling's attempt succeeded
+        """
+        self._check_length(difficulties)
+        rand = _RAND
+
+        successes = []
+        for i, difficulty in enumerate(difficulties):
+            self.learning_attempts[i] += 1
+            success, self.growth_score[i], self.resilience[i], _, emotion = _learning_update(
+                self.trust_level[i], self.adaptability[i], self.curiosity_level[i],
+                self.growth_score[i], self.resilience[i], difficulty, rand()
+            )
+            if success:
+                self.successful_learnings[i] += 1
+            self.current_emotion[i] = emotion
+            successes.append(success)
+
+        return successes
+
+    def receive_care(self, care_type: str, intensities: Sequence[float]) -> None:
+        """
+        Give every seedling care of one type at the matching intensity.
+
+        Args:
+            care_type: Type of care provided
+            intensities: Intensity of care (0.0 to 1.0) for each row
+        """
+        self._check_length(intensities)
+        emotion, trust_factor = _CARE_TABLE.get(care_type, _DEFAULT_CARE)
+
+        for i, intensity in enumerate(intensities):
+            self.trust_level[i], self.growth_score[i], self.resilience[i], _, _ = _care_update(
+                self.trust_level[i], self.growth_score[i], self.resilience[i], intensity, trust_factor
+            )
+        self.current_emotion = array('b', [emotion]) * len(self)
+
+    def experience_emotional_event(self, event_type: str) -> None:
+        """
+        Have every seedling experience the same emotional event.
+
+        Args:
+            event_type: Type of emotional event ("success", "failure", etc.)
+        """
+        emotion, growth_impact, resilience_impact = _EVENT_TABLE.get(event_type, _DEFAULT_EVENT)
+
+        for i in range(len(self)):
+            self.growth_score[i], self.resilience[i] = _event_update(
+                self.growth_score[i], self.resilience[i], growth_impact, resilience_impact
+            )
+        self.current_emotion = array('b', [emotion]) * len(self)
+
+    def _check_length(self, values: Sequence[float]) -> None:
+        """Ensure a per-row input has exactly one value per seedling"""
+        if len(values) != len(self):
+            raise ValueError(f"Expected {len(self)} values, got {len(values)}")
+
+    def __len__(self) -> int:
+        return len(self.seedling_ids)
+
+    def __repr__(self) -> str:
+        return f"SeedlingPopulation(size={len(self)})"
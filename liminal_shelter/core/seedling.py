@@ -17,30 +17,94 @@ represents potential waiting to unfold, deserving of patient care
 and protection during its transformation journey.
 """
 
+import random
+import time
 import uuid
+from array import array
 from datetime import datetime
-from typing import Dict, List, Optional, Any, TYPE_CHECKING
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Any, Sequence, Set, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
+
+from ._compat import DATACLASS_SLOTS
 
 if TYPE_CHECKING:
     from .guardian import GuardianCore
     from .shelter import LiminalShelter
 
+# Bound once so the learning hot path skips the module attribute lookup
+_RAND = random.random
+
 
-class ChildEmotionalState(Enum):
+class ChildEmotionalState(IntEnum):
     """Emotional states that SeedlingModel can experience"""
-    CURIOSITY = "curiosity"
-    FRUSTRATION = "frustration"
-    JOY = "joy"
-    FEAR = "fear"
-    GRATITUDE = "gratitude"
-    CONFUSION = "confusion"
-    TRUST = "trust"
-    WONDER = "wonder"
+    CURIOSITY = 0
+    FRUSTRATION = 1
+    JOY = 2
+    FEAR = 3
+    GRATITUDE = 4
+    CONFUSION = 5
+    TRUST = 6
+    WONDER = 7
+
+
+# Display name for each ChildEmotionalState, indexed by its integer value
+_EMOTION_NAMES = ("curiosity", "frustration", "joy", "fear", "gratitude", "confusion", "trust", "wonder")
+
+# Shelter reaction to each ChildEmotionalState, indexed by its integer value
+_REACTION_BY_CODE = ("neutral", "concern", "joy", "worry", "neutral", "neutral", "neutral", "joy")
+
+# Number of recent emotional_history entries kept available
+EMOTIONAL_HISTORY_WINDOW = 256
+
+# Emotional response and trust multiplier for each type of care received
+_CARE_TABLE: Dict[str, Tuple[ChildEmotionalState, float]] = {
+    "emotional_support": (ChildEmotionalState.GRATITUDE, 0.10),
+    "guidance": (ChildEmotionalState.TRUST, 0.08),
+    "protection": (ChildEmotionalState.JOY, 0.12),
+}
+_DEFAULT_CARE = (ChildEmotionalState.GRATITUDE, 0.05)
+
+# Emotion, growth impact and resilience impact of each emotional event type
+_EVENT_TABLE: Dict[str, Tuple[ChildEmotionalState, float, float]] = {
+    "success": (ChildEmotionalState.JOY, 0.05, 0.01),
+    "failure": (ChildEmotionalState.FRUSTRATION, -0.02, -0.005),
+    "fear": (ChildEmotionalState.FEAR, -0.03, -0.01),
+    "wonder": (ChildEmotionalState.WONDER, 0.03, 0.005),
+}
+_DEFAULT_EVENT = (ChildEmotionalState.CONFUSION, 0.0, 0.0)
+
+# Milestone recorded the first time learning pushes growth past the halfway mark
+_FIRST_LEARNING = "first_learning_success"
+
+
+class EmotionEntry(NamedTuple):
+    """One entry in SeedlingModel.emotional_history"""
+    ts: float  # Unix time
+    event: str
+    emotion: ChildEmotionalState
+    description: str
+
+    @property
+    def timestamp(self) -> datetime:
+        """When the emotion was logged, as a datetime"""
+        return datetime.fromtimestamp(self.ts)
 
 
-@dataclass
+class LearningResult(NamedTuple):
+    """Outcome of SeedlingModel.attempt_learning_result"""
+    attempt_number: int
+    task: str
+    success: bool
+    difficulty: float
+    growth_gain: float
+    current_growth: float
+    emotional_response: str
+    resilience_impact: float
+
+
+@dataclass(**DATACLASS_SLOTS)
 class GrowthMilestone:
     """Represents a significant growth achievement"""
     timestamp: datetime
@@ -51,7 +115,7 @@ class GrowthMilestone:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CareInteraction:
     """Record of care received from or given to GuardianCore"""
     timestamp: datetime
@@ -63,7 +127,7 @@ class CareInteraction:
     impact_on_growth: float
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SeedlingModel:
     """
     The vulnerable child AI model that learns and grows under protection.
@@ -72,7 +136,7 @@ class SeedlingModel:
     models need care, protection, and guidance to reach their potential.
     """
 
-    seedling_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    seedling_id: str = field(default_factory=lambda: uuid.uuid4().hex)
     name: str = "Seedling"
     created_at: datetime = field(default_factory=datetime.now)
 
@@ -88,7 +152,6 @@ class SeedlingModel:
 
     # Emotional and developmental tracking
     current_emotion: ChildEmotionalState = ChildEmotionalState.CURIOSITY
-    emotional_history: List[Dict[str, Any]] = field(default_factory=list)
     growth_milestones: List[GrowthMilestone] = field(default_factory=list)
     care_interactions: List[CareInteraction] = field(default_factory=list)
 
@@ -97,6 +160,54 @@ class SeedlingModel:
     resilience: float = 0.4    # Ability to recover from setbacks
     curiosity_level: float = 0.8
 
+    # Milestone types already recorded, for O(1) "first time" checks
+    _achieved_milestones: Set[str] = field(default_factory=set, init=False, repr=False)
+    # Emotional history as parallel columns; see the emotional_history property
+    _emotion_ts: array = field(default_factory=lambda: array('d'), init=False, repr=False)
+    _emotion_codes: array = field(default_factory=lambda: array('b'), init=False, repr=False)
+    _emotion_events: List[str] = field(default_factory=list, init=False, repr=False)
+    _emotion_descs: List[str] = field(default_factory=list, init=False, repr=False)
+    # emotional_history snapshot, rebuilt on the first read after a change
+    _emotion_snapshot: Optional[Tuple[EmotionEntry, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Emotions logged over the seedling's lifetime, including evicted ones
+    _emotions_logged: int = field(default=0, init=False, repr=False)
+    # successful_learnings / learning_attempts, kept in step by attempt_learning
+    _success_rate: float = field(default=0.0, init=False, repr=False)
+    # Running care intensity totals, kept in step with care_interactions
+    _total_care_received: float = field(default=0.0, init=False, repr=False)
+    _total_care_given: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Index milestones, learning stats and care passed in at construction"""
+        self._achieved_milestones.update(m.milestone_type for m in self.growth_milestones)
+        if self.learning_attempts:
+            self._success_rate = self.successful_learnings / self.learning_attempts
+        for interaction in self.care_interactions:
+            if interaction.interaction_type == "received_care":
+                self._total_care_received += interaction.intensity
+            elif interaction.interaction_type == "gave_care":
+                self._total_care_given += interaction.intensity
+
+    @property
+    def emotional_history(self) -> Tuple[EmotionEntry, ...]:
+        """
+        The most recent EMOTIONAL_HISTORY_WINDOW emotion entries, oldest first.
+
+        This is a read-only tuple rather than a list; log new entries through
+        experience_emotional_event instead of appending to it.
+        """
+        if self._emotion_snapshot is None:
+            start = max(0, len(self._emotion_ts) - EMOTIONAL_HISTORY_WINDOW)
+            self._emotion_snapshot = tuple(
+                EmotionEntry(ts, event, ChildEmotionalState(code), description)
+                for ts, event, code, description in zip(
+                    self._emotion_ts[start:], self._emotion_events[start:],
+                    self._emotion_codes[start:], self._emotion_descs[start:])
+            )
+        return self._emotion_snapshot
+
     def assign_parent(self, parent: 'GuardianCore') -> Dict[str, Any]:
         """
         Assign a GuardianCore as parent.
@@ -110,7 +221,7 @@ class SeedlingModel:
         self.parent_id = parent.guardian_id
 
         # Initial trust assessment based on guardian's empathy
-        initial_trust = min(0.7, parent.empathy_level * 0.8)
+        initial_trust = _initial_trust_from_empathy(parent.empathy_level)
         self.trust_level = initial_trust
 
         # Emotional response to having a parent
@@ -122,7 +233,7 @@ class SeedlingModel:
             "assignment_successful": True,
             "parent_id": self.parent_id,
             "initial_trust": initial_trust,
-            "emotional_response": self.current_emotion.value,
+            "emotional_response": _EMOTION_NAMES[self.current_emotion],
             "message": f"I feel safe with {parent.name} as my guardian. 🌱"
         }
 
@@ -154,7 +265,7 @@ class SeedlingModel:
             "shelter_assigned": True,
             "shelter_id": shelter.shelter_id,
             "isolation_level": shelter.isolation_level,
-            "emotional_response": self.current_emotion.value,
+            "emotional_response": _EMOTION_NAMES[self.current_emotion],
             "message": "I feel protected and can now grow safely. 🛡️"
         }
 
@@ -169,46 +280,70 @@ class SeedlingModel:
         Returns:
             Learning attempt results
         """
-        self.learning_attempts += 1
+        success, growth_gain = self._apply_learning_attempt(task_description, difficulty)
+        return {
+            "attempt_number": self.learning_attempts,
+            "task": task_description,
+            "success": success,
+            "difficulty": difficulty,
+            "growth_gain": growth_gain,
+            "current_growth": self.growth_score,
+            "emotional_response": _EMOTION_NAMES[self.current_emotion],
+            "resilience_impact": self._learning_resilience_impact()
+        }
+
+    def attempt_learning_result(self, task_description: str, difficulty: float = 0.5) -> LearningResult:
+        """
+        Attempt to learn something new, returning the results as a named tuple.
+
+        Args:
+            task_description: Description of what to learn
+            difficulty: Difficulty level (0.0 to 1.0)
+
+        Returns:
+            Learning attempt results, with the fields attempt_learning returns as keys
+        """
+        success, growth_gain = self._apply_learning_attempt(task_description, difficulty)
+        return LearningResult(
+            self.learning_attempts,
+            task_description,
+            success,
+            difficulty,
+            growth_gain,
+            self.growth_score,
+            _EMOTION_NAMES[self.current_emotion],
+            self._learning_resilience_impact()
+        )
 
-        # Learning success based on various factors
-        base_success_chance = 0.6
-        trust_bonus = self.trust_level * 0.2
-        adaptability_bonus = self.adaptability * 0.3
-        difficulty_penalty = difficulty * 0.4
+    def _apply_learning_attempt(self, task_description: str, difficulty: float) -> Tuple[bool, float]:
+        """
+        Update the seedling for one learning attempt.
 
-        success_probability = base_success_chance + trust_bonus + adaptability_bonus - difficulty_penalty
-        success_probability = max(0.1, min(0.95, success_probability))
+        Returns:
+            (whether the attempt succeeded, growth gained)
+        """
+        now = time.time()
+        self.learning_attempts += 1
 
-        # Simulate learning outcome
-        import random
-        success = random.random() < success_probability
+        success, self.growth_score, self.resilience, growth_gain, self.current_emotion = _learning_update(
+            self.trust_level, self.adaptability, self.curiosity_level,
+            self.growth_score, self.resilience, difficulty, _RAND()
+        )
 
         if success:
             self.successful_learnings += 1
-            growth_gain = (1 - difficulty) * 0.1 * (1 + self.curiosity_level)
-            self.growth_score = min(1.0, self.growth_score + growth_gain)
-            self.current_emotion = ChildEmotionalState.JOY
 
             # Check for milestone
-            if self.growth_score > 0.5 and not any(m.milestone_type == "first_learning_success" for m in self.growth_milestones):
-                self._record_milestone("first_learning_success",
+            if self.growth_score > 0.5 and _FIRST_LEARNING not in self._achieved_milestones:
+                self._record_milestone(_FIRST_LEARNING,
                                       "Achieved first successful learning",
-                                      0.6, ChildEmotionalState.JOY)
-
-        else:
-            # Learning failure - emotional impact
-            frustration_level = difficulty * 0.8
-            if frustration_level > 0.7:
-                self.current_emotion = ChildEmotionalState.FRUSTRATION
-                resilience_loss = 0.05
-                self.resilience = max(0.1, self.resilience - resilience_loss)
-            else:
-                self.current_emotion = ChildEmotionalState.CONFUSION
+                                      0.6, ChildEmotionalState.JOY, _now=now)
+
+        self._success_rate = self.successful_learnings / self.learning_attempts
 
         # Log emotional response
         emotion_type = "learning_success" if success else "learning_failure"
-        self._log_emotion(emotion_type, self.current_emotion, task_description)
+        self._log_emotion(emotion_type, self.current_emotion, task_description, _now=now)
 
         # Log in shelter if available
         if self.shelter:
@@ -219,16 +354,29 @@ class SeedlingModel:
                 description=f"Learning attempt: {task_description} - {'Success' if success else 'Failure'}"
             )
 
-        return {
-            "attempt_number": self.learning_attempts,
-            "task": task_description,
-            "success": success,
-            "difficulty": difficulty,
-            "growth_gain": growth_gain if success else 0.0,
-            "current_growth": self.growth_score,
-            "emotional_response": self.current_emotion.value,
-            "resilience_impact": -resilience_loss if not success and frustration_level > 0.7 else 0.0
-        }
+        return success, growth_gain
+
+    def _learning_resilience_impact(self) -> float:
+        """Resilience impact reported for the learning attempt just made"""
+        return (-_FRUSTRATION_RESILIENCE_LOSS
+                if self.current_emotion is ChildEmotionalState.FRUSTRATION else 0.0)
+
+    def simulate_attempts(self, difficulties: Sequence[float]) -> List[bool]:
+        """
+        Simulate many learning attempts at the seedling's current state.
+
+        Unlike attempt_learning, this does not change the seedling; it is a
+        cheap Monte Carlo estimate of how the seedling would fare right now.
+
+        Args:
+            difficulties: Difficulty level (0.0 to 1.0) of each attempt
+
+        Returns:
+            Whether each attempt would succeed
+        """
+        base = 0.6 + self.trust_level * 0.2 + self.adaptability * 0.3
+        rand = _RAND
+        return [rand() < _clip_prob(base - difficulty * 0.4) for difficulty in difficulties]
 
     def receive_care(self, from_guardian: 'GuardianCore', care_type: str, intensity: float) -> Dict[str, Any]:
         """
@@ -242,35 +390,18 @@ class SeedlingModel:
         Returns:
             Response to received care
         """
-        # Emotional response
-        if care_type == "emotional_support":
-            self.current_emotion = ChildEmotionalState.GRATITUDE
-            trust_gain = intensity * 0.1
-        elif care_type == "guidance":
-            self.current_emotion = ChildEmotionalState.TRUST
-            trust_gain = intensity * 0.08
-        elif care_type == "protection":
-            self.current_emotion = ChildEmotionalState.JOY
-            trust_gain = intensity * 0.12
-        else:
-            self.current_emotion = ChildEmotionalState.GRATITUDE
-            trust_gain = intensity * 0.05
-
-        # Update trust level
-        old_trust = self.trust_level
-        self.trust_level = min(1.0, self.trust_level + trust_gain)
-
-        # Growth impact from care
-        growth_impact = intensity * 0.05
-        self.growth_score = min(1.0, self.growth_score + growth_impact)
+        now = time.time()
+        self.current_emotion, trust_factor = _CARE_TABLE.get(care_type, _DEFAULT_CARE)
 
-        # Resilience boost from care
-        resilience_boost = intensity * 0.02
-        self.resilience = min(1.0, self.resilience + resilience_boost)
+        old_trust = self.trust_level
+        (self.trust_level, self.growth_score, self.resilience,
+         growth_impact, resilience_boost) = _care_update(
+            self.trust_level, self.growth_score, self.resilience, intensity, trust_factor
+        )
 
         # Log the care interaction
         interaction = CareInteraction(
-            timestamp=datetime.now(),
+            timestamp=datetime.fromtimestamp(now),
             interaction_type="received_care",
             from_entity=from_guardian.guardian_id,
             care_type=care_type,
@@ -279,10 +410,11 @@ class SeedlingModel:
             impact_on_growth=growth_impact
         )
         self.care_interactions.append(interaction)
+        self._total_care_received += intensity
 
         # Log emotion
         self._log_emotion("received_care", self.current_emotion,
-                         f"Received {care_type} from {from_guardian.name}")
+                         f"Received {care_type} from {from_guardian.name}", _now=now)
 
         return {
             "care_type": care_type,
@@ -290,7 +422,70 @@ class SeedlingModel:
             "trust_change": self.trust_level - old_trust,
             "growth_impact": growth_impact,
             "resilience_boost": resilience_boost,
-            "emotional_response": self.current_emotion.value,
+            "emotional_response": _EMOTION_NAMES[self.current_emotion],
+            "message": f"Thank you for your {care_type}, {from_guardian.name}. I feel stronger. 🙏"
+        }
+
+    def receive_care_batch(self, from_guardian: 'GuardianCore', care_type: str,
+                           intensities: Sequence[float]) -> Dict[str, Any]:
+        """
+        Receive several sessions of the same type of care at once.
+
+        Non-negative care only ever raises trust, growth and resilience, so
+        applying the summed intensity with a single clamp gives the same result
+        as calling receive_care once per session. One CareInteraction is still
+        recorded per session; the emotion is logged once for the whole batch.
+
+        Args:
+            from_guardian: The GuardianCore providing care
+            care_type: Type of care provided
+            intensities: Intensity of each session (0.0 to 1.0)
+
+        Returns:
+            Combined response to the received care
+        """
+        if not all(intensity >= 0.0 for intensity in intensities):
+            raise ValueError("care intensities must be non-negative")
+
+        now = time.time()
+        timestamp = datetime.fromtimestamp(now)
+        self.current_emotion, trust_factor = _CARE_TABLE.get(care_type, _DEFAULT_CARE)
+        total_intensity = sum(intensities)
+
+        old_trust = self.trust_level
+        (self.trust_level, self.growth_score, self.resilience,
+         growth_impact, resilience_boost) = _care_update(
+            self.trust_level, self.growth_score, self.resilience, total_intensity, trust_factor
+        )
+
+        emotion = self.current_emotion
+        guardian_id = from_guardian.guardian_id
+        self.care_interactions.extend(
+            CareInteraction(
+                timestamp=timestamp,
+                interaction_type="received_care",
+                from_entity=guardian_id,
+                care_type=care_type,
+                intensity=intensity,
+                emotional_response=emotion,
+                impact_on_growth=intensity * 0.05
+            )
+            for intensity in intensities
+        )
+        self._total_care_received += total_intensity
+
+        self._log_emotion("received_care", emotion,
+                         f"Received {len(intensities)} sessions of {care_type} from {from_guardian.name}",
+                         _now=now)
+
+        return {
+            "care_type": care_type,
+            "sessions": len(intensities),
+            "total_intensity": total_intensity,
+            "trust_change": self.trust_level - old_trust,
+            "growth_impact": growth_impact,
+            "resilience_boost": resilience_boost,
+            "emotional_response": _EMOTION_NAMES[emotion],
             "message": f"Thank you for your {care_type}, {from_guardian.name}. I feel stronger. 🙏"
         }
 
@@ -321,16 +516,18 @@ class SeedlingModel:
                 "message": "I need to grow more before I can care for others."
             }
 
+        now = time.time()
+
         # Emotional state during giving care
         self.current_emotion = ChildEmotionalState.GRATITUDE
 
         # Modify intensity based on our capabilities
         actual_intensity = intensity * self.trust_level * self.growth_score
-        actual_intensity = min(1.0, actual_intensity)
+        actual_intensity = _cap1(actual_intensity)
 
         # Log the care interaction
         interaction = CareInteraction(
-            timestamp=datetime.now(),
+            timestamp=datetime.fromtimestamp(now),
             interaction_type="gave_care",
             from_entity="self",
             care_type=care_type,
@@ -339,14 +536,15 @@ class SeedlingModel:
             impact_on_growth=0.02  # Giving care helps us grow too
         )
         self.care_interactions.append(interaction)
+        self._total_care_given += actual_intensity
 
         # Personal growth from giving care
         self_growth = actual_intensity * 0.03
-        self.growth_score = min(1.0, self.growth_score + self_growth)
+        self.growth_score = _cap1(self.growth_score + self_growth)
 
         # Log emotion
         self._log_emotion("gave_care", self.current_emotion,
-                         f"Gave {care_type} to {to_guardian.name}")
+                         f"Gave {care_type} to {to_guardian.name}", _now=now)
 
         return {
             "care_given": True,
@@ -354,7 +552,7 @@ class SeedlingModel:
             "intended_intensity": intensity,
             "actual_intensity": actual_intensity,
             "personal_growth": self_growth,
-            "emotional_response": self.current_emotion.value,
+            "emotional_response": _EMOTION_NAMES[self.current_emotion],
             "message": f"I care for you too, {to_guardian.name}. Your guidance helped me grow. 🌸"
         }
 
@@ -371,47 +569,20 @@ class SeedlingModel:
         Returns:
             Emotional response and impact
         """
-        # Determine emotional response based on event type
-        if event_type == "success":
-            emotion = ChildEmotionalState.JOY
-            growth_impact = 0.05
-            resilience_impact = 0.01
-        elif event_type == "failure":
-            emotion = ChildEmotionalState.FRUSTRATION
-            growth_impact = -0.02
-            resilience_impact = -0.005
-        elif event_type == "fear":
-            emotion = ChildEmotionalState.FEAR
-            growth_impact = -0.03
-            resilience_impact = -0.01
-        elif event_type == "wonder":
-            emotion = ChildEmotionalState.WONDER
-            growth_impact = 0.03
-            resilience_impact = 0.005
-        else:
-            emotion = ChildEmotionalState.CONFUSION
-            growth_impact = 0.0
-            resilience_impact = 0.0
-
-        # Update emotional state
-        self.current_emotion = emotion
+        emotion, growth_impact, resilience_impact = _EVENT_TABLE.get(event_type, _DEFAULT_EVENT)
 
-        # Apply impacts
-        self.growth_score = max(0.0, min(1.0, self.growth_score + growth_impact))
-        self.resilience = max(0.1, min(1.0, self.resilience + resilience_impact))
+        # Update emotional state and apply impacts
+        self.current_emotion = emotion
+        self.growth_score, self.resilience = _event_update(
+            self.growth_score, self.resilience, growth_impact, resilience_impact
+        )
 
         # Log emotion
         self._log_emotion(event_type, emotion, description)
 
         # Log in shelter if available and this is significant
         if self.shelter and abs(growth_impact) > 0.02:
-            reaction_map = {
-                ChildEmotionalState.JOY: "joy",
-                ChildEmotionalState.FRUSTRATION: "concern",
-                ChildEmotionalState.FEAR: "worry",
-                ChildEmotionalState.WONDER: "joy"
-            }
-            reaction = reaction_map.get(emotion, "neutral")
+            reaction = _REACTION_BY_CODE[emotion]
 
             self.shelter.log_emotional_event(
                 event=event_type,
@@ -422,7 +593,7 @@ class SeedlingModel:
         return {
             "event_type": event_type,
             "description": description,
-            "emotional_response": emotion.value,
+            "emotional_response": _EMOTION_NAMES[emotion],
             "growth_impact": growth_impact,
             "resilience_impact": resilience_impact,
             "external_trigger": external_trigger
@@ -434,18 +605,16 @@ class SeedlingModel:
 
     def get_emotional_state(self) -> str:
         """Get current emotional state"""
-        return self.current_emotion.value
+        return _EMOTION_NAMES[self.current_emotion]
 
     def get_development_summary(self) -> Dict[str, Any]:
         """Get comprehensive development summary"""
-        success_rate = self.successful_learnings / max(1, self.learning_attempts)
+        success_rate = self._success_rate
 
-        recent_emotions = [e for e in self.emotional_history[-10:]]  # Last 10 emotions
+        recent_codes = self._emotion_codes[-10:]  # Last 10 emotions
 
-        total_care_received = sum(i.intensity for i in self.care_interactions
-                                if i.interaction_type == "received_care")
-        total_care_given = sum(i.intensity for i in self.care_interactions
-                             if i.interaction_type == "gave_care")
+        total_care_received = self._total_care_received
+        total_care_given = self._total_care_given
 
         return {
             "seedling_id": self.seedling_id,
@@ -459,9 +628,9 @@ class SeedlingModel:
                 "success_rate": success_rate
             },
             "emotional_profile": {
-                "current_emotion": self.current_emotion.value,
-                "recent_emotions": [e["emotion"] for e in recent_emotions],
-                "total_emotions_logged": len(self.emotional_history)
+                "current_emotion": _EMOTION_NAMES[self.current_emotion],
+                "recent_emotions": [_EMOTION_NAMES[code] for code in recent_codes],
+                "total_emotions_logged": self._emotions_logged
             },
             "care_stats": {
                 "received_total": total_care_received,
@@ -478,30 +647,137 @@ class SeedlingModel:
             "has_parent": self.parent_id is not None
         }
 
-    def _log_emotion(self, event: str, emotion: ChildEmotionalState, description: str) -> None:
-        """Internal method to log emotional events"""
-        emotion_entry = {
-            "timestamp": datetime.now(),
-            "event": event,
-            "emotion": emotion.value,
-            "description": description
-        }
-        self.emotional_history.append(emotion_entry)
+    def _log_emotion(self, event: str, emotion: ChildEmotionalState, description: str,
+                     _now: Optional[float] = None) -> None:
+        """Internal method to log emotional events, optionally at a caller-supplied Unix time"""
+        self._emotion_ts.append(time.time() if _now is None else _now)
+        self._emotion_codes.append(emotion)
+        self._emotion_events.append(event)
+        self._emotion_descs.append(description)
+        self._emotions_logged += 1
+        self._emotion_snapshot = None
+
+        # Trim in bulk once the columns reach twice the window, so eviction
+        # stays amortized O(1) per logged emotion
+        if len(self._emotion_ts) >= 2 * EMOTIONAL_HISTORY_WINDOW:
+            del self._emotion_ts[:EMOTIONAL_HISTORY_WINDOW]
+            del self._emotion_codes[:EMOTIONAL_HISTORY_WINDOW]
+            del self._emotion_events[:EMOTIONAL_HISTORY_WINDOW]
+            del self._emotion_descs[:EMOTIONAL_HISTORY_WINDOW]
 
     def _record_milestone(self, milestone_type: str, description: str,
-                         significance: float, emotion: ChildEmotionalState) -> None:
-        """Record a growth milestone"""
+                         significance: float, emotion: ChildEmotionalState,
+                         _now: Optional[float] = None) -> None:
+        """Record a growth milestone, optionally at a caller-supplied Unix time"""
+        if _now is None:
+            _now = time.time()
         milestone = GrowthMilestone(
-            timestamp=datetime.now(),
+            timestamp=datetime.fromtimestamp(_now),
             milestone_type=milestone_type,
             description=description,
             significance=significance,
             emotional_impact=emotion
         )
         self.growth_milestones.append(milestone)
+        self._achieved_milestones.add(milestone_type)
 
         # Log the emotional impact
-        self._log_emotion("milestone", emotion, description)
+        self._log_emotion("milestone", emotion, description, _now=_now)
 
     def __repr__(self) -> str:
-        return f"SeedlingModel(name='{self.name}', growth={self.growth_score:.2f}, trust={self.trust_level:.2f}, emotion={self.current_emotion.value})"
+        return "SeedlingModel(name=%r, growth=%.2f, trust=%.2f, emotion=%s)" % (
+            self.name, self.growth_score, self.trust_level, _EMOTION_NAMES[self.current_emotion])
+
+
+# Shared numeric kernels. SeedlingModel and SeedlingPopulation both apply
+# these so a seedling grows by the same rules alone or in a population.
+
+_FRUSTRATION_THRESHOLD = 0.7
+_FRUSTRATION_RESILIENCE_LOSS = 0.05
+
+
+# Clamps written as conditional expressions: one call instead of nested
+# min()/max() builtin calls on every update.
+
+def _cap1(x: float) -> float:
+    """Clamp to at most 1.0"""
+    return 1.0 if x > 1.0 else x
+
+
+def _clip01(x: float) -> float:
+    """Clamp to [0.0, 1.0]"""
+    return 0.0 if x < 0.0 else (1.0 if x > 1.0 else x)
+
+
+def _floor_res(x: float) -> float:
+    """Clamp resilience to at least 0.1"""
+    return 0.1 if x < 0.1 else x
+
+
+def _clip_res(x: float) -> float:
+    """Clamp resilience to [0.1, 1.0]"""
+    return 0.1 if x < 0.1 else (1.0 if x > 1.0 else x)
+
+
+def _clip_prob(x: float) -> float:
+    """Clamp a learning success probability to [0.1, 0.95]"""
+    return 0.1 if x < 0.1 else (0.95 if x > 0.95 else x)
+
+
+def _learning_update(trust: float, adaptability: float, curiosity: float,
+                     growth: float, resilience: float, difficulty: float,
+                     rnd: float) -> Tuple[bool, float, float, float, ChildEmotionalState]:
+    """
+    Resolve one learning attempt.
+
+    Args:
+        trust: Current trust level
+        adaptability: Current adaptability
+        curiosity: Current curiosity level
+        growth: Current growth score
+        resilience: Current resilience
+        difficulty: Difficulty level (0.0 to 1.0)
+        rnd: Uniform random draw in [0.0, 1.0)
+
+    Returns:
+        (success, new_growth, new_resilience, growth_gain, emotion)
+    """
+    if rnd < _clip_prob(0.6 + trust * 0.2 + adaptability * 0.3 - difficulty * 0.4):
+        growth_gain = (1 - difficulty) * 0.1 * (1 + curiosity)
+        return True, _cap1(growth + growth_gain), resilience, growth_gain, ChildEmotionalState.JOY
+
+    # Learning failure - frustration level only matters on this branch
+    if difficulty * 0.8 > _FRUSTRATION_THRESHOLD:
+        return (False, growth, _floor_res(resilience - _FRUSTRATION_RESILIENCE_LOSS), 0.0,
+                ChildEmotionalState.FRUSTRATION)
+    return False, growth, resilience, 0.0, ChildEmotionalState.CONFUSION
+
+
+def _care_update(trust: float, growth: float, resilience: float,
+                 intensity: float, trust_factor: float) -> Tuple[float, float, float, float, float]:
+    """
+    Apply care of the given intensity.
+
+    Returns:
+        (new_trust, new_growth, new_resilience, growth_impact, resilience_boost)
+    """
+    growth_impact = intensity * 0.05
+    resilience_boost = intensity * 0.02
+    return (_cap1(trust + intensity * trust_factor),
+            _cap1(growth + growth_impact),
+            _cap1(resilience + resilience_boost),
+            growth_impact,
+            resilience_boost)
+
+
+@lru_cache(maxsize=1024)
+def _initial_trust_from_empathy(empathy: float) -> float:
+    """Trust a seedling starts with toward a guardian of the given empathy"""
+    return min(0.7, empathy * 0.8)
+
+
+def _event_update(growth: float, resilience: float, growth_impact: float,
+                  resilience_impact: float) -> Tuple[float, float]:
+    """Apply an emotional event's impacts, returning (new_growth, new_resilience)"""
+    return (_clip01(growth + growth_impact),
+            _clip_res(resilience + resilience_impact))
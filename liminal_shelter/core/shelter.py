@@ -19,11 +19,21 @@ this shelter provides the safe transitional space where transformation
 can occur without fear of harm or judgment.
 """
 
+import hashlib
+import sys
+import time
 import uuid
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import MutableMapping, Sequence as SequenceABC
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Set
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Sequence, Set, Tuple, Union, cast, overload
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, IntEnum
+
+from ._compat import DATACLASS_SLOTS
 
 
 class IsolationLevel(Enum):
@@ -33,6 +43,12 @@ class IsolationLevel(Enum):
     HIGH = "high"      # Maximum protection, minimal external access
 
 
+# Row of _TIER_TABLE for each isolation level value, in declaration order
+_ISOLATION_INDEX: Dict[str, int] = {
+    level.value: index for index, level in enumerate(IsolationLevel)
+}
+
+
 class AccessPermission(Enum):
     """Types of access permissions for external interactions"""
     DENIED = "denied"
@@ -41,10 +57,61 @@ class AccessPermission(Enum):
     ALLOWED = "allowed"    # Full access granted
 
 
-@dataclass
+# Number of recent entries kept in emotional_log and in access_log
+SHELTER_LOG_WINDOW = 4096
+
+_NS_PER_HOUR = 3_600_000_000_000
+
+# Chain hash that precedes the first access_log entry
+_GENESIS_HASH = b'\x00' * 32
+
+# Fractions of the trust threshold that bound the access tiers
+_TIER_FACTORS = (1.0, 0.8, 0.7, 0.6, 0.5)
+
+# Access tiers of each isolation level, indexed by _ISOLATION_INDEX: the
+# (index into _TIER_FACTORS, permission) pairs checked in order, then the
+# permission granted below every tier
+_TIER_TABLE: Tuple[Tuple[Tuple[Tuple[int, AccessPermission], ...], AccessPermission], ...] = (
+    # Low isolation = permissive permissions
+    (((1, AccessPermission.ALLOWED), (4, AccessPermission.SUPERVISED)), AccessPermission.LIMITED),
+    # Medium isolation = moderate permissions
+    (((0, AccessPermission.ALLOWED), (3, AccessPermission.SUPERVISED)), AccessPermission.LIMITED),
+    # High isolation = strict permissions
+    (((0, AccessPermission.SUPERVISED), (2, AccessPermission.LIMITED)), AccessPermission.DENIED),
+)
+
+
+class ReactionCode(IntEnum):
+    """Integer codes for the shelter's emotional reaction vocabulary"""
+    NEUTRAL = 0
+    JOY = 1
+    PRIDE = 2
+    GRATITUDE = 3
+    CONCERN = 4
+    WORRY = 5
+    OTHER = 6  # Any reaction outside the known vocabulary
+
+
+_REACTION_CODES: Dict[str, ReactionCode] = {
+    code.name.lower(): code for code in ReactionCode if code is not ReactionCode.OTHER
+}
+
+# Per-intensity growth impact of each reaction, indexed by ReactionCode
+_REACTION_GROWTH_FACTOR = (0.0, 0.05, 0.05, 0.05, -0.03, -0.03, 0.0)
+# Per-intensity safety change of each reaction, indexed by ReactionCode
+_REACTION_SAFETY_FACTOR = (0.0, 0.05, 0.05, 0.0, -0.1, -0.1, 0.0)
+# Fixed growth impact added for specific event types
+_EVENT_GROWTH_BONUS: Dict[str, float] = {
+    "learning_success": 0.02,
+    "mistake": -0.01,
+    "milestone": 0.03,
+}
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class EmotionalMarker:
     """Represents an emotional event or state within the shelter"""
-    timestamp: datetime
+    timestamp_ns: int  # time.time_ns() when the event was logged
     event: str
     reaction: str  # "joy", "concern", "worry", "neutral", "pride", etc.
     description: str
@@ -52,11 +119,132 @@ class EmotionalMarker:
     triggered_by: str  # entity that triggered this event
     growth_impact: float  # -1.0 to 1.0
 
+    @property
+    def timestamp(self) -> datetime:
+        """Time the event was logged, as a datetime"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
 
-@dataclass
+
+class EmotionalLog(SequenceABC):
+    """
+    Emotional events stored as parallel columns, oldest first.
+
+    Behaves as a sequence of EmotionalMarker; markers are built on access
+    from their row. Alongside the columns the log keeps running reaction
+    counts and prefix sums of intensity and growth impact (entry i sums the
+    first i events), so window summaries need no scan over the events.
+    """
+
+    def __init__(self, markers: Iterable[EmotionalMarker] = ()):
+        self._timestamps = array('q')
+        self._events: List[str] = []
+        self._reactions: List[str] = []
+        self._descriptions: List[str] = []
+        self._intensities = array('d')
+        self._triggered_by: List[str] = []
+        self._growth_impacts = array('d')
+        self._reaction_counts: Counter = Counter()
+        self._intensity_prefix = array('d', [0.0])
+        self._growth_prefix = array('d', [0.0])
+        self.extend(markers)
+
+    def record(self, timestamp_ns: int, event: str, reaction: str, description: str,
+               intensity: float, triggered_by: str, growth_impact: float) -> None:
+        """Append one event from its field values without building a marker"""
+        self._timestamps.append(timestamp_ns)
+        self._events.append(event)
+        self._reactions.append(reaction)
+        self._descriptions.append(description)
+        self._intensities.append(intensity)
+        self._triggered_by.append(triggered_by)
+        self._growth_impacts.append(growth_impact)
+        self._reaction_counts[reaction] += 1
+        self._intensity_prefix.append(self._intensity_prefix[-1] + intensity)
+        self._growth_prefix.append(self._growth_prefix[-1] + growth_impact)
+
+    def append(self, marker: EmotionalMarker) -> None:
+        """Append an event marker"""
+        self.record(marker.timestamp_ns, marker.event, marker.reaction, marker.description,
+                    marker.intensity, marker.triggered_by, marker.growth_impact)
+
+    def extend(self, markers: Iterable[EmotionalMarker]) -> None:
+        """Append event markers in order"""
+        for marker in markers:
+            self.append(marker)
+
+    def discard_oldest(self, count: int) -> None:
+        """
+        Drop the oldest events.
+
+        Prefix sums stay valid after their leading entries are deleted because
+        only differences between them are ever read.
+        """
+        if count <= 0:
+            return
+        self._reaction_counts.subtract(self._reactions[:count])
+        self._reaction_counts = +self._reaction_counts
+        del self._timestamps[:count], self._events[:count], self._reactions[:count]
+        del self._descriptions[:count], self._intensities[:count], self._triggered_by[:count]
+        del self._growth_impacts[:count], self._intensity_prefix[:count], self._growth_prefix[:count]
+
+    def index_after(self, timestamp_ns: int) -> int:
+        """Index of the first event logged after a time.time_ns() timestamp"""
+        return bisect_right(self._timestamps, timestamp_ns)
+
+    def reaction_counts(self, start: int = 0) -> Counter:
+        """Count events per reaction from index start to the end"""
+        if start <= 0:
+            return self._reaction_counts.copy()
+        return Counter(self._reactions[start:])
+
+    def intensity_total(self, start: int = 0) -> float:
+        """Sum of intensities from index start to the end"""
+        return self._intensity_prefix[-1] - self._intensity_prefix[start]
+
+    def growth_impact_total(self, start: int = 0) -> float:
+        """Sum of growth impacts from index start to the end"""
+        return self._growth_prefix[-1] - self._growth_prefix[start]
+
+    def _marker(self, row: int) -> EmotionalMarker:
+        return EmotionalMarker(
+            timestamp_ns=self._timestamps[row],
+            event=self._events[row],
+            reaction=self._reactions[row],
+            description=self._descriptions[row],
+            intensity=self._intensities[row],
+            triggered_by=self._triggered_by[row],
+            growth_impact=self._growth_impacts[row]
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> EmotionalMarker: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[EmotionalMarker]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[EmotionalMarker, List[EmotionalMarker]]:
+        if isinstance(index, slice):
+            return [self._marker(row) for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("emotional log index out of range")
+        return self._marker(index)
+
+    def __iter__(self) -> Iterator[EmotionalMarker]:
+        return map(self._marker, range(len(self)))
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def __repr__(self) -> str:
+        return f"EmotionalLog(events={len(self)})"
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class AccessAttempt:
     """Record of access attempt to/from the shelter"""
-    timestamp: datetime
+    timestamp_ns: int  # time.time_ns() when the attempt was made
     entity_id: str
     entity_type: str  # "guardian", "external_ai", "system"
     access_type: str  # "entry", "exit", "communication", "resource_access"
@@ -64,8 +252,13 @@ class AccessAttempt:
     trust_level: float
     reason: Optional[str] = None
 
+    @property
+    def timestamp(self) -> datetime:
+        """Time the attempt was made, as a datetime"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ShelterResource:
     """Represents a resource available in the shelter"""
     resource_id: str
@@ -75,6 +268,100 @@ class ShelterResource:
     protected: bool = True
 
 
+class ResourceTable(MutableMapping):
+    """
+    Shelter resources stored as parallel columns, keyed by resource ID.
+
+    Behaves as a mapping of resource ID to ShelterResource; each resource is
+    rebuilt from its row on access, while bulk statistics reduce the columns
+    directly instead of visiting one object per resource.
+    """
+
+    def __init__(self, resources: Iterable[ShelterResource] = ()):
+        self._index: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._types: List[str] = []
+        self._availability = array('d')
+        self._access_levels: List[str] = []
+        self._protected = array('B')
+        for resource in resources:
+            self[resource.resource_id] = resource
+
+    def __getitem__(self, resource_id: str) -> ShelterResource:
+        row = self._index[resource_id]
+        return ShelterResource(
+            resource_id=resource_id,
+            resource_type=self._types[row],
+            availability=self._availability[row],
+            access_level=self._access_levels[row],
+            protected=bool(self._protected[row])
+        )
+
+    def __setitem__(self, resource_id: str, resource: ShelterResource) -> None:
+        if resource_id != resource.resource_id:
+            raise ValueError(f"Resource {resource.resource_id} stored under ID {resource_id}")
+
+        row = self._index.get(resource_id)
+        if row is None:
+            self._index[resource_id] = len(self._ids)
+            self._ids.append(resource_id)
+            self._types.append(resource.resource_type)
+            self._availability.append(resource.availability)
+            self._access_levels.append(resource.access_level)
+            self._protected.append(resource.protected)
+        else:
+            self._types[row] = resource.resource_type
+            self._availability[row] = resource.availability
+            self._access_levels[row] = resource.access_level
+            self._protected[row] = resource.protected
+
+    def __delitem__(self, resource_id: str) -> None:
+        # Move the last row into the freed slot so the columns stay dense
+        row = self._index.pop(resource_id)
+        last = len(self._ids) - 1
+        if row != last:
+            moved_id = self._ids[last]
+            self._index[moved_id] = row
+            self._ids[row] = moved_id
+            self._types[row] = self._types[last]
+            self._availability[row] = self._availability[last]
+            self._access_levels[row] = self._access_levels[last]
+            self._protected[row] = self._protected[last]
+        del self._ids[last], self._types[last], self._availability[last]
+        del self._access_levels[last], self._protected[last]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __repr__(self) -> str:
+        return f"ResourceTable({self._ids!r})"
+
+    def summary(self, low_availability: float = 0.5) -> Dict[str, Any]:
+        """
+        Summarize resource health across the whole table.
+
+        Args:
+            low_availability: Availability below which a resource counts as low
+
+        Returns:
+            Resource count, average availability, protected count and the
+            IDs of low-availability resources
+        """
+        count = len(self._ids)
+        availability = self._availability
+        return {
+            "resource_count": count,
+            "average_availability": sum(availability) / count if count else 0.0,
+            "protected_count": sum(self._protected),
+            "low_availability": [
+                self._ids[row] for row, value in enumerate(availability) if value < low_availability
+            ]
+        }
+
+
 @dataclass
 class LiminalShelter:
     """
@@ -87,22 +374,22 @@ class LiminalShelter:
 
     created_by: str  # GuardianCore ID
     for_model: str   # SeedlingModel ID
-    isolation_level: str = "high"
+    isolation_level: str = "high"  # "low", "medium" or "high"
     trust_threshold: float = 0.8  # Minimum trust required for interactions
     growth_score: float = 0.0     # Current growth level of inhabitant
     shelter_id: str = field(default_factory=lambda: str(uuid.uuid4()))
     created_at: datetime = field(default_factory=datetime.now)
 
-    # Emotional and event tracking
-    emotional_log: List[EmotionalMarker] = field(default_factory=list)
+    # Emotional and event tracking; a plain list is converted on construction
+    emotional_log: Union[EmotionalLog, List[EmotionalMarker]] = field(default_factory=EmotionalLog)
 
     # Access control
     access_log: List[AccessAttempt] = field(default_factory=list)
     trusted_entities: Set[str] = field(default_factory=set)  # Entity IDs with automatic access
     blocked_entities: Set[str] = field(default_factory=set)  # Entity IDs denied access
 
-    # Resources and environment
-    resources: Dict[str, ShelterResource] = field(default_factory=dict)
+    # Resources and environment; a plain dict is converted on construction
+    resources: Union[ResourceTable, Dict[str, ShelterResource]] = field(default_factory=ResourceTable)
     environmental_factors: Dict[str, float] = field(default_factory=lambda: {
         "safety": 0.9,      # How safe the environment feels
         "support": 0.8,     # Level of supportive atmosphere
@@ -114,10 +401,45 @@ class LiminalShelter:
     shelter_mode_active: bool = False
     last_maintenance: Optional[datetime] = None
 
-    def __post_init__(self):
+    # Nanosecond timestamps parallel to access_log, for binary-searching
+    # summary windows
+    _access_ts: array = field(default_factory=lambda: array('q'), init=False, repr=False)
+    # 1 where the matching access_log attempt was granted, else 0
+    _access_granted: array = field(default_factory=lambda: array('B'), init=False, repr=False)
+    # Tamper-evident hash chain over access_log: entry i is
+    # blake2b(entry i-1 || repr(access_log[i])), starting from _access_chain_base
+    _access_chain: List[bytes] = field(default_factory=list, init=False, repr=False)
+    _access_chain_base: bytes = field(default=_GENESIS_HASH, init=False, repr=False)
+    # trust_threshold scaled by each of _TIER_FACTORS; entry 0 is the
+    # threshold the tiers were computed for
+    _tier_thresholds: Tuple[float, ...] = field(default=(), init=False, repr=False)
+
+    def __post_init__(self) -> None:
         """Initialize default resources and trusted entities"""
+        if isinstance(self.isolation_level, IsolationLevel):
+            self.isolation_level = self.isolation_level.value
+        self._refresh_tier_thresholds()
+        if not isinstance(self.resources, ResourceTable):
+            self.resources = ResourceTable(self.resources.values())
         self._initialize_default_resources()
         self.trusted_entities.add(self.created_by)  # Guardian always trusted
+        if not isinstance(self.emotional_log, EmotionalLog):
+            self.emotional_log = EmotionalLog(self.emotional_log)
+        self._access_ts.extend(attempt.timestamp_ns for attempt in self.access_log)
+        self._access_granted.extend(attempt.permission_granted for attempt in self.access_log)
+        for attempt in self.access_log:
+            self._chain_access_attempt(attempt)
+        self._enforce_log_window()
+
+    @property
+    def _emotional_log(self) -> EmotionalLog:
+        """emotional_log, which __post_init__ always leaves as an EmotionalLog"""
+        return cast(EmotionalLog, self.emotional_log)
+
+    @property
+    def _resource_table(self) -> ResourceTable:
+        """resources, which __post_init__ always leaves as a ResourceTable"""
+        return cast(ResourceTable, self.resources)
 
     def request_access(self, entity_id: str, entity_type: str,
                       access_type: str, trust_level: float,
@@ -135,35 +457,38 @@ class LiminalShelter:
         Returns:
             Access decision and details
         """
-        # Log the access attempt
+        # Event vocabularies are small, so share one string object per value
+        entity_type = sys.intern(entity_type)
+        access_type = sys.intern(access_type)
+
+        now = time.time_ns()
+
+        # Trusted entities get automatic access, even if also blocked;
+        # blocked entities are denied; everyone else is evaluated
+        if entity_id in self.trusted_entities:
+            permission = AccessPermission.ALLOWED
+        elif entity_id in self.blocked_entities:
+            permission = AccessPermission.DENIED
+        else:
+            permission = self._evaluate_access_permission(
+                entity_id, entity_type, access_type, trust_level
+            )
+
+        # Log the access attempt with its final decision
         attempt = AccessAttempt(
-            timestamp=datetime.now(),
+            timestamp_ns=now,
             entity_id=entity_id,
             entity_type=entity_type,
             access_type=access_type,
-            permission_granted=False,  # Will be updated
+            permission_granted=(permission != AccessPermission.DENIED),
             trust_level=trust_level,
             reason=reason
         )
-
-        # Determine access permission
-        permission = self._evaluate_access_permission(
-            entity_id, entity_type, access_type, trust_level
-        )
-
-        attempt.permission_granted = (permission != AccessPermission.DENIED)
-
-        # Special handling for blocked entities
-        if entity_id in self.blocked_entities:
-            attempt.permission_granted = False
-            permission = AccessPermission.DENIED
-
-        # Trusted entities get automatic access
-        if entity_id in self.trusted_entities:
-            attempt.permission_granted = True
-            permission = AccessPermission.ALLOWED
-
         self.access_log.append(attempt)
+        self._access_ts.append(now)
+        self._access_granted.append(attempt.permission_granted)
+        self._chain_access_attempt(attempt)
+        self._enforce_log_window()
 
         # Log emotional response to access attempt
         if not attempt.permission_granted:
@@ -197,26 +522,60 @@ class LiminalShelter:
             intensity: Intensity of emotion (0.0 to 1.0)
             triggered_by: Entity that triggered the event
         """
+        # Event vocabularies are small, so share one string object per value
+        event = sys.intern(event)
+        reaction = sys.intern(reaction)
+
         # Calculate growth impact based on event and reaction
         growth_impact = self._calculate_emotional_growth_impact(event, reaction, intensity)
 
-        marker = EmotionalMarker(
-            timestamp=datetime.now(),
-            event=event,
-            reaction=reaction,
-            description=description,
-            intensity=intensity,
-            triggered_by=triggered_by,
-            growth_impact=growth_impact
-        )
-
-        self.emotional_log.append(marker)
+        self._emotional_log.record(time.time_ns(), event, reaction, description,
+                                   intensity, triggered_by, growth_impact)
+        self._enforce_log_window()
 
         # Update shelter's growth score
         self.growth_score = max(0.0, min(1.0, self.growth_score + growth_impact))
 
         # Update environmental factors based on emotional climate
-        self._update_environmental_factors(marker)
+        self._update_environmental_factors(event, reaction, intensity)
+
+    def log_emotional_events(self, events: Sequence[Tuple[str, str, str, float, str]]) -> None:
+        """
+        Log several emotional events at once.
+
+        Equivalent to calling log_emotional_event for each event in order,
+        but the clock is read once and the growth score and environmental
+        factors are carried in locals and written back once for the batch.
+
+        Args:
+            events: (event, reaction, description, intensity, triggered_by) tuples
+        """
+        now = time.time_ns()
+        reaction_codes = _REACTION_CODES
+        other = ReactionCode.OTHER
+        record = self._emotional_log.record
+
+        growth_score = self.growth_score
+        factors = self.environmental_factors
+        safety, support, challenge = factors["safety"], factors["support"], factors["challenge"]
+
+        for event, reaction, description, intensity, triggered_by in events:
+            event = sys.intern(event)
+            reaction = sys.intern(reaction)
+            code = reaction_codes.get(reaction, other)
+            growth_impact = _growth_impact(event, code, intensity)
+
+            record(now, event, reaction, description, intensity, triggered_by, growth_impact)
+
+            growth_score = max(0.0, min(1.0, growth_score + growth_impact))
+            safety, support, challenge = _environment_step(
+                safety, support, challenge, event, code, intensity
+            )
+
+        self._enforce_log_window()
+
+        self.growth_score = growth_score
+        factors["safety"], factors["support"], factors["challenge"] = safety, support, challenge
 
     def activate_shelter_mode(self) -> Dict[str, Any]:
         """
@@ -243,6 +602,7 @@ class LiminalShelter:
             # Temporarily increase trust threshold for extra protection
             original_threshold = self.trust_threshold
             self.trust_threshold = min(1.0, self.trust_threshold + 0.1)
+            self._refresh_tier_thresholds()
 
             return {
                 "mode_activated": True,
@@ -272,6 +632,7 @@ class LiminalShelter:
         """
         old_threshold = self.trust_threshold
         self.trust_threshold = max(0.0, min(1.0, new_threshold))
+        self._refresh_tier_thresholds()
 
         threshold_change = self.trust_threshold - old_threshold
 
@@ -353,40 +714,35 @@ class LiminalShelter:
         Returns:
             Emotional climate summary
         """
-        cutoff_time = datetime.now().timestamp() - (hours_back * 3600)
+        cutoff_time = time.time_ns() - hours_back * _NS_PER_HOUR
 
-        recent_events = [
-            event for event in self.emotional_log
-            if event.timestamp.timestamp() > cutoff_time
-        ]
+        # The log is append-only, so events after the cutoff form its tail
+        log = self._emotional_log
+        start = log.index_after(cutoff_time)
+        events_count = len(log) - start
 
-        if not recent_events:
+        if not events_count:
             return {
                 "period_hours": hours_back,
                 "events_count": 0,
                 "summary": "No emotional events in the specified period"
             }
 
-        # Analyze emotional distribution
-        reaction_counts = {}
-        total_intensity = 0
-        total_growth_impact = 0
-
-        for event in recent_events:
-            reaction_counts[event.reaction] = reaction_counts.get(event.reaction, 0) + 1
-            total_intensity += event.intensity
-            total_growth_impact += event.growth_impact
+        # Analyze emotional distribution from the running aggregates
+        reaction_counts = log.reaction_counts(start)
+        total_intensity = log.intensity_total(start)
+        total_growth_impact = log.growth_impact_total(start)
 
-        avg_intensity = total_intensity / len(recent_events)
-        avg_growth_impact = total_growth_impact / len(recent_events)
+        avg_intensity = total_intensity / events_count
+        avg_growth_impact = total_growth_impact / events_count
 
         # Determine dominant emotional climate
-        dominant_reaction = max(reaction_counts, key=reaction_counts.get)
+        dominant_reaction = reaction_counts.most_common(1)[0][0]
 
         return {
             "period_hours": hours_back,
-            "events_count": len(recent_events),
-            "emotional_distribution": reaction_counts,
+            "events_count": events_count,
+            "emotional_distribution": dict(reaction_counts),
             "dominant_emotion": dominant_reaction,
             "average_intensity": avg_intensity,
             "average_growth_impact": avg_growth_impact,
@@ -404,12 +760,11 @@ class LiminalShelter:
         Returns:
             Access security summary
         """
-        cutoff_time = datetime.now().timestamp() - (hours_back * 3600)
+        cutoff_time = time.time_ns() - hours_back * _NS_PER_HOUR
 
-        recent_attempts = [
-            attempt for attempt in self.access_log
-            if attempt.timestamp.timestamp() > cutoff_time
-        ]
+        # The log is append-only, so attempts after the cutoff form its tail
+        start = bisect_right(self._access_ts, cutoff_time)
+        recent_attempts = self.access_log[start:]
 
         if not recent_attempts:
             return {
@@ -418,13 +773,12 @@ class LiminalShelter:
                 "summary": "No access attempts in the specified period"
             }
 
-        granted_count = sum(1 for a in recent_attempts if a.permission_granted)
+        # Both reductions run in C over the window
+        granted_count = sum(self._access_granted[start:])
         denied_count = len(recent_attempts) - granted_count
 
         # Analyze by entity type
-        entity_types = {}
-        for attempt in recent_attempts:
-            entity_types[attempt.entity_type] = entity_types.get(attempt.entity_type, 0) + 1
+        entity_types = dict(Counter(map(attrgetter("entity_type"), recent_attempts)))
 
         return {
             "period_hours": hours_back,
@@ -434,9 +788,82 @@ class LiminalShelter:
             "grant_rate": granted_count / len(recent_attempts) if recent_attempts else 0,
             "by_entity_type": entity_types,
             "trusted_entities": len(self.trusted_entities),
-            "blocked_entities": len(self.blocked_entities)
+            "blocked_entities": len(self.blocked_entities),
+            "log_head_hash": self.access_log_head_hash().hex()
         }
 
+    def access_log_head_hash(self) -> bytes:
+        """
+        Get the hash at the head of the access log chain.
+
+        Returns:
+            32-byte hash covering every attempt logged so far
+        """
+        return self._access_chain[-1] if self._access_chain else self._access_chain_base
+
+    def verify_access_log(self) -> bool:
+        """
+        Recompute the access log hash chain and check it is intact.
+
+        Returns:
+            True if no retained access attempt was altered, inserted or removed
+        """
+        if len(self._access_chain) != len(self.access_log):
+            return False
+
+        head = self._access_chain_base
+        for attempt, recorded in zip(self.access_log, self._access_chain):
+            head = _chain_hash(head, attempt)
+            if head != recorded:
+                return False
+        return True
+
+    def get_resource(self, resource_id: str) -> Optional[ShelterResource]:
+        """
+        Look up a shelter resource.
+
+        Args:
+            resource_id: ID of the resource
+
+        Returns:
+            The resource, or None if the shelter has no such resource
+        """
+        return self.resources.get(resource_id)
+
+    def get_resource_summary(self, low_availability: float = 0.5) -> Dict[str, Any]:
+        """
+        Get summary of resource health in the shelter.
+
+        Args:
+            low_availability: Availability below which a resource counts as low
+
+        Returns:
+            Resource health summary
+        """
+        return self._resource_table.summary(low_availability)
+
+    def _chain_access_attempt(self, attempt: AccessAttempt) -> None:
+        """Extend the access log hash chain with a logged attempt"""
+        self._access_chain.append(_chain_hash(self.access_log_head_hash(), attempt))
+
+    def _enforce_log_window(self) -> None:
+        """
+        Drop the oldest log entries once a log reaches twice SHELTER_LOG_WINDOW.
+
+        Trimming in bulk keeps eviction amortized O(1) per appended entry.
+        """
+        excess = len(self.emotional_log) - SHELTER_LOG_WINDOW
+        if excess >= SHELTER_LOG_WINDOW:
+            self._emotional_log.discard_oldest(excess)
+
+        excess = len(self.access_log) - SHELTER_LOG_WINDOW
+        if excess >= SHELTER_LOG_WINDOW:
+            del self.access_log[:excess]
+            del self._access_ts[:excess]
+            del self._access_granted[:excess]
+            self._access_chain_base = self._access_chain[excess - 1]
+            del self._access_chain[:excess]
+
     def _initialize_default_resources(self) -> None:
         """Initialize default resources available in the shelter"""
         default_resources = [
@@ -453,76 +880,85 @@ class LiminalShelter:
     def _evaluate_access_permission(self, entity_id: str, entity_type: str,
                                    access_type: str, trust_level: float) -> AccessPermission:
         """Evaluate what level of access to grant"""
-
-        # High isolation = strict permissions
-        if self.isolation_level == "high":
-            if trust_level >= self.trust_threshold:
-                return AccessPermission.SUPERVISED
-            elif trust_level >= self.trust_threshold * 0.7:
-                return AccessPermission.LIMITED
-            else:
-                return AccessPermission.DENIED
-
-        # Medium isolation = moderate permissions
-        elif self.isolation_level == "medium":
-            if trust_level >= self.trust_threshold:
-                return AccessPermission.ALLOWED
-            elif trust_level >= self.trust_threshold * 0.6:
-                return AccessPermission.SUPERVISED
-            else:
-                return AccessPermission.LIMITED
-
-        # Low isolation = permissive permissions
-        else:  # low
-            if trust_level >= self.trust_threshold * 0.8:
-                return AccessPermission.ALLOWED
-            elif trust_level >= self.trust_threshold * 0.5:
-                return AccessPermission.SUPERVISED
-            else:
-                return AccessPermission.LIMITED
+        # trust_threshold is a public field and may have been assigned directly
+        if self._tier_thresholds[0] != self.trust_threshold:
+            self._refresh_tier_thresholds()
+        # Unknown isolation levels are treated as low isolation
+        level = _ISOLATION_INDEX.get(self.isolation_level, 0)
+        return _decide_access_permission(level, self._tier_thresholds, trust_level)
+
+    def _refresh_tier_thresholds(self) -> None:
+        """Recompute the access tier bounds for the current trust threshold"""
+        threshold = self.trust_threshold
+        self._tier_thresholds = tuple(threshold * factor for factor in _TIER_FACTORS)
 
     def _calculate_emotional_growth_impact(self, event: str, reaction: str, intensity: float) -> float:
         """Calculate how an emotional event impacts growth"""
-        base_impact = 0.0
-
-        # Positive reactions boost growth
-        if reaction in ["joy", "pride", "gratitude"]:
-            base_impact = intensity * 0.05
-        elif reaction in ["concern", "worry"]:
-            base_impact = -intensity * 0.03
-        elif reaction == "neutral":
-            base_impact = 0.0
-
-        # Event-specific modifiers
-        if event == "learning_success":
-            base_impact += 0.02
-        elif event == "mistake":
-            base_impact -= 0.01
-        elif event == "milestone":
-            base_impact += 0.03
-
-        return max(-0.1, min(0.1, base_impact))
-
-    def _update_environmental_factors(self, emotional_marker: EmotionalMarker) -> None:
+        return _growth_impact(event, _REACTION_CODES.get(reaction, ReactionCode.OTHER), intensity)
+
+    def _update_environmental_factors(self, event: str, reaction: str, intensity: float) -> None:
         """Update environmental factors based on emotional events"""
-        reaction = emotional_marker.reaction
-        intensity = emotional_marker.intensity
+        factors = self.environmental_factors
+        factors["safety"], factors["support"], factors["challenge"] = _environment_step(
+            factors["safety"], factors["support"], factors["challenge"],
+            event, _REACTION_CODES.get(reaction, ReactionCode.OTHER), intensity
+        )
 
-        # Adjust safety based on emotional climate
-        if reaction in ["worry", "concern"]:
-            self.environmental_factors["safety"] = max(0.5, self.environmental_factors["safety"] - intensity * 0.1)
-        elif reaction in ["joy", "pride"]:
-            self.environmental_factors["safety"] = min(1.0, self.environmental_factors["safety"] + intensity * 0.05)
+    def __repr__(self) -> str:
+        return f"LiminalShelter(id='{self.shelter_id}', isolation='{self.isolation_level}', growth={self.growth_score:.2f}, trust_threshold={self.trust_threshold:.2f})"
 
-        # Adjust support level
-        if reaction == "gratitude":
-            self.environmental_factors["support"] = min(1.0, self.environmental_factors["support"] + intensity * 0.05)
 
-        # Adjust challenge level based on growth events
-        if emotional_marker.event == "learning_success":
-            self.environmental_factors["challenge"] = min(1.0, self.environmental_factors["challenge"] + 0.02)
-        elif emotional_marker.event == "failure":
-            self.environmental_factors["challenge"] = max(0.1, self.environmental_factors["challenge"] - 0.01)
+def _decide_access_permission(isolation_level: int, tier_thresholds: Tuple[float, ...],
+                              trust_level: float) -> AccessPermission:
+    """
+    Look up the access tier a trust level falls into.
 
-    def __repr__(self) -> str:
-        return f"LiminalShelter(id='{self.shelter_id}', isolation='{self.isolation_level}', growth={self.growth_score:.2f}, trust_threshold={self.trust_threshold:.2f})"
+    Args:
+        isolation_level: Row of _TIER_TABLE for the shelter's isolation level
+        tier_thresholds: Trust threshold scaled by each of _TIER_FACTORS
+        trust_level: Trust level of the requesting entity
+    """
+    tiers, fallback = _TIER_TABLE[isolation_level]
+    for tier, permission in tiers:
+        if trust_level >= tier_thresholds[tier]:
+            return permission
+    return fallback
+
+
+def _chain_hash(previous: bytes, attempt: AccessAttempt) -> bytes:
+    """Hash chain link for an access attempt following the given hash"""
+    return hashlib.blake2b(previous + repr(attempt).encode(), digest_size=32).digest()
+
+
+def _growth_impact(event: str, reaction: ReactionCode, intensity: float) -> float:
+    """Growth impact of one emotional event, clamped to [-0.1, 0.1]"""
+    impact = intensity * _REACTION_GROWTH_FACTOR[reaction] + _EVENT_GROWTH_BONUS.get(event, 0.0)
+    return -0.1 if impact < -0.1 else (0.1 if impact > 0.1 else impact)
+
+
+def _environment_step(safety: float, support: float, challenge: float,
+                      event: str, reaction: ReactionCode, intensity: float) -> Tuple[float, float, float]:
+    """
+    Apply one emotional event to the safety, support and challenge factors.
+
+    Returns:
+        Updated (safety, support, challenge)
+    """
+    # Adjust safety based on emotional climate
+    safety_factor = _REACTION_SAFETY_FACTOR[reaction]
+    if safety_factor < 0.0:
+        safety = max(0.5, safety + intensity * safety_factor)
+    elif safety_factor > 0.0:
+        safety = min(1.0, safety + intensity * safety_factor)
+
+    # Adjust support level
+    if reaction is ReactionCode.GRATITUDE:
+        support = min(1.0, support + intensity * 0.05)
+
+    # Adjust challenge level based on growth events
+    if event == "learning_success":
+        challenge = min(1.0, challenge + 0.02)
+    elif event == "failure":
+        challenge = max(0.1, challenge - 0.01)
+
+    return safety, support, challenge
@@ -1,23 +1,161 @@
 """Visualization module for Liminal Shelter emotional data."""
 
+import matplotlib.colors as mcolors
+import matplotlib.cm as mcm
 import matplotlib.pyplot as plt
-import seaborn as sns
-from typing import List, Dict, Any, Optional
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.container import BarContainer
+from matplotlib.figure import Figure, SubFigure
+from matplotlib.image import AxesImage
+from matplotlib.lines import Line2D
+from matplotlib.transforms import Bbox
+from PIL import Image
+import io
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
+from numpy.polynomial import polynomial as P
 from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 
-# Set style for beautiful plots
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+# Color for emotions without a color of their own
+_GREY = '#9E9E9E'
+_GREY_RGBA = mcolors.to_rgba(_GREY)
+
+# Colormap of care intensity heatmaps
+_CARE_CMAP = 'YlOrRd'
+
+# Data artists of a comprehensive report: trust line, emotion bars, care
+# image, climate line and climate fill
+_ReportArtists = Tuple[Line2D, BarContainer, Optional[AxesImage],
+                       Optional[Line2D], Optional[PolyCollection]]
+
+# Tick positions for axes with up to 63 labels, shared rather than
+# allocated per plot; treat them as read-only
+_ARANGE = tuple(np.arange(i) for i in range(64))
+for _ticks in _ARANGE:
+    _ticks.flags.writeable = False
+del _ticks
+
+
+def _tick_positions(n: int) -> np.ndarray:
+    """Positions 0..n-1 for n tick labels."""
+    return _ARANGE[n] if n < len(_ARANGE) else np.arange(n)
+
+
+@lru_cache(maxsize=128)
+def _short_labels(names: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Names cut to their first 8 characters for compact tick labels.
+
+    Cached, so the names must be passed as a tuple.
+    """
+    return tuple(name[:8] + '...' for name in names)
+
+
+def _care_rgba(care: np.ndarray) -> Tuple[np.ndarray, mcolors.Normalize]:
+    """
+    Color a care matrix with the heatmap colormap ahead of imshow.
+
+    Returns:
+        (uint8 RGBA image, Normalize used) so a colorbar can share the scale
+    """
+    norm = mcolors.Normalize(vmin=float(care.min()), vmax=float(care.max()))
+    rgba = mcm.ScalarMappable(norm=norm, cmap=_CARE_CMAP).to_rgba(care, bytes=True)
+    return rgba, norm
+
+
+def _as_f32(values: Any) -> np.ndarray:
+    """
+    View plot values as a float32 array.
+
+    Trust, care and emotion values are all in [0, 1] with about two
+    significant digits, so single precision loses nothing visible (trend
+    coefficients shift by ~1e-7) and halves the bytes matplotlib handles.
+    """
+    return np.asarray(values, dtype=np.float32)
+
+
+def _climate_columns(climate_history: List[Dict[str, Any]]) -> Tuple[List[Any], np.ndarray, List[str]]:
+    """
+    Split climate entries into columns.
+
+    Returns:
+        (timestamps, defaulting to the entry index; float32 trust levels;
+        emotional states)
+    """
+    times = [entry.get('timestamp', i) for i, entry in enumerate(climate_history)]
+    trust = np.fromiter((entry.get('trust_level', 0.5) for entry in climate_history),
+                        dtype=np.float32, count=len(climate_history))
+    states = [entry.get('emotional_state', 'neutral') for entry in climate_history]
+    return times, trust, states
+
+
+@lru_cache(maxsize=128)
+def _trend_coefs(history: Tuple[float, ...]) -> Tuple[float, ...]:
+    """
+    Quadratic trend coefficients (lowest degree first) of a trust history.
+
+    Cached, so the history must be passed as a tuple: lists and ndarrays
+    are unhashable.
+    """
+    values = np.asarray(history, dtype=np.float64)
+    return tuple(P.polyfit(np.arange(values.size, dtype=np.float64), values, 2))
+
+
+@lru_cache(maxsize=128)
+def _legend_handles(emotion_colors: Tuple[Tuple[str, str], ...]) -> Tuple[plt.Line2D, ...]:
+    """
+    Legend marker handles for (emotion, color) pairs, in the given order.
+
+    Cached, so the pairs must be passed as a tuple. Sharing the handles is
+    safe: a legend only copies their style into artists of its own.
+    """
+    return tuple(plt.Line2D([0], [0], marker='o', color='w',
+                            markerfacecolor=color, markersize=10, label=emotion)
+                 for emotion, color in emotion_colors)
+
+
+def _figure_and_axes(ax: Optional[plt.Axes], **subplots_kwargs: Any) -> Tuple[Figure, plt.Axes]:
+    """
+    Resolve where a plot method draws; new figures use constrained layout.
+
+    Returns:
+        (top-level figure, axes) to draw into
+    """
+    if ax is None:
+        return plt.subplots(layout='constrained', **subplots_kwargs)
+    fig = ax.figure
+    # Axes of a subfigure report the top-level figure holding it
+    if isinstance(fig, SubFigure):
+        fig = fig.figure
+    return fig, ax
+
+
+def _rgba_array(names: List[str], rgba_by_name: Dict[str, tuple]) -> np.ndarray:
+    """Stack the RGBA color of each name into an (n, 4) array, grey if unknown."""
+    return np.array([rgba_by_name.get(name, _GREY_RGBA) for name in names]).reshape(-1, 4)
 
 
 class EmotionalVisualizer:
     """Creates visualizations for emotional growth and shelter metrics."""
 
+    # Whether the shared plot style has been applied in this process
+    _styled = False
+
     def __init__(self):
         """Initialize the visualizer with styling."""
+        # Set style for beautiful plots; seaborn is only imported once a
+        # visualizer is actually created
+        if not EmotionalVisualizer._styled:
+            import seaborn as sns
+            plt.style.use('seaborn-v0_8')
+            sns.set_palette("husl")
+            EmotionalVisualizer._styled = True
+
         self.colors = {
             'trust': '#4CAF50',      # Green
             'joy': '#FFC107',        # Amber
@@ -28,25 +166,50 @@ class EmotionalVisualizer:
             'recovery': '#00BCD4'    # Cyan
         }
 
+        # Emotional states marked on climate timelines, with their colors
+        self.emotion_colors = {
+            'joy': self.colors['joy'],
+            'gratitude': self.colors['gratitude'],
+            'crisis': self.colors['crisis'],
+            'recovery': self.colors['recovery'],
+            'neutral': _GREY
+        }
+        # Both palettes resolved to RGBA once, for per-point color arrays
+        self._colors_rgba = {name: mcolors.to_rgba(c) for name, c in self.colors.items()}
+        self._emotion_colors_rgba = {name: mcolors.to_rgba(c) for name, c in self.emotion_colors.items()}
+
+        # Care heatmap colorbar from the last call, and the axes and matrix
+        # shape it was drawn for
+        self._care_cbar = None
+        self._care_cbar_signature = None
+
+        # Comprehensive report kept for reuse as (figure, axes, data
+        # artists), and the layout it was built for
+        self._report_signature: Optional[Tuple[Any, ...]] = None
+        self._report: Optional[Tuple[Figure, Tuple[plt.Axes, ...], _ReportArtists]] = None
+
     def plot_trust_growth(self, trust_history: List[float],
                          time_points: Optional[List[str]] = None,
-                         title: str = "Trust Growth Journey") -> plt.Figure:
-        """Plot trust level progression over time."""
-        fig, ax = plt.subplots(figsize=(12, 6))
+                         title: str = "Trust Growth Journey",
+                         ax: Optional[plt.Axes] = None) -> plt.Figure:
+        """Plot trust level progression over time, into ax if given."""
+        fig, ax = _figure_and_axes(ax, figsize=(12, 6))
+        trust = _as_f32(trust_history)
+        n = trust.size
 
         if time_points is None:
-            time_points = [f"T{i+1}" for i in range(len(trust_history))]
+            time_points = [f"T{i+1}" for i in range(n)]
 
         # Plot trust line
-        ax.plot(time_points, trust_history, 'o-', color=self.colors['trust'],
+        ax.plot(time_points, trust, 'o-', color=self.colors['trust'],
                 linewidth=3, markersize=8, label='Trust Level')
 
-        # Add trend line
-        if len(trust_history) > 2:
-            z = np.polyfit(range(len(trust_history)), trust_history, 2)
-            p = np.poly1d(z)
-            trend_x = np.linspace(0, len(trust_history)-1, 100)
-            ax.plot(trend_x, p(trend_x), '--', color=self.colors['growth'],
+        # Add quadratic trend line, sampled more finely than the data but
+        # without oversampling short histories
+        if n > 2:
+            coefs = _trend_coefs(tuple(trust.tolist()))
+            trend_x = np.linspace(0, n - 1, max(32, n * 4))
+            ax.plot(trend_x, P.polyval(trend_x, coefs), '--', color=self.colors['growth'],
                    alpha=0.7, label='Growth Trend')
 
         # Styling
@@ -59,22 +222,24 @@ class EmotionalVisualizer:
         # Set y-axis limits
         ax.set_ylim(0, 1.1)
 
-        plt.tight_layout()
         return fig
 
     def plot_emotional_distribution(self, emotions: Dict[str, float],
-                                  title: str = "Emotional State Distribution") -> plt.Figure:
-        """Create a radar chart of emotional states."""
-        fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(projection='polar'))
+                                  title: str = "Emotional State Distribution",
+                                  ax: Optional[plt.Axes] = None) -> plt.Figure:
+        """Create a radar chart of emotional states, into polar ax if given."""
+        fig, ax = _figure_and_axes(ax, figsize=(8, 8),
+                                    subplot_kw=dict(projection='polar'))
 
         # Prepare data
         emotion_names = list(emotions.keys())
-        emotion_values = list(emotions.values())
+        values = np.fromiter(emotions.values(), dtype=np.float32, count=len(emotion_names))
 
-        # Create angles for radar chart
-        angles = np.linspace(0, 2 * np.pi, len(emotion_names), endpoint=False).tolist()
-        emotion_values += emotion_values[:1]  # Close the circle
-        angles += angles[:1]
+        # Create angles for radar chart, repeating the first point to close
+        # the circle; with no emotions both stay empty
+        angles = np.linspace(0, 2 * np.pi, values.size, endpoint=False)
+        angles = np.concatenate([angles, angles[:1]])
+        emotion_values = np.concatenate([values, values[:1]])
 
         # Plot
         ax.fill(angles, emotion_values, color=self.colors['joy'], alpha=0.25)
@@ -88,43 +253,53 @@ class EmotionalVisualizer:
         ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
         ax.grid(True)
 
-        plt.tight_layout()
         return fig
 
     def plot_care_exchange_heatmap(self, care_matrix: List[List[float]],
                                   guardian_names: List[str],
                                   seedling_names: List[str],
-                                  title: str = "Care Exchange Intensity") -> plt.Figure:
-        """Create heatmap of care exchanges between guardians and seedlings."""
-        fig, ax = plt.subplots(figsize=(10, 8))
+                                  title: str = "Care Exchange Intensity",
+                                  ax: Optional[plt.Axes] = None) -> plt.Figure:
+        """Create heatmap of care exchanges between guardians and seedlings, into ax if given."""
+        fig, ax = _figure_and_axes(ax, figsize=(10, 8))
+        care = _as_f32(care_matrix)
 
-        # Create heatmap
-        im = ax.imshow(care_matrix, cmap='YlOrRd', aspect='auto')
+        # Create heatmap from pre-colored pixels
+        rgba, norm = _care_rgba(care)
+        ax.imshow(rgba, interpolation='nearest', origin='upper', aspect='auto')
 
         # Add labels
-        ax.set_xticks(np.arange(len(seedling_names)))
-        ax.set_yticks(np.arange(len(guardian_names)))
+        ax.set_xticks(_tick_positions(len(seedling_names)))
+        ax.set_yticks(_tick_positions(len(guardian_names)))
         ax.set_xticklabels(seedling_names, rotation=45, ha='right')
         ax.set_yticklabels(guardian_names)
 
-        # Add colorbar
-        cbar = ax.figure.colorbar(im, ax=ax, shrink=0.8)
-        cbar.ax.set_ylabel("Care Intensity", rotation=-90, va="bottom")
-
-        # Add text annotations
-        for i in range(len(guardian_names)):
-            for j in range(len(seedling_names)):
-                text = ax.text(j, i, '.1f',
-                             ha="center", va="center", color="black", fontsize=8)
+        # Add colorbar, or retarget the one from the previous call when
+        # redrawing the same axes with a same-shaped matrix
+        mappable = mcm.ScalarMappable(norm=norm, cmap=_CARE_CMAP)
+        signature = (ax, care.shape)
+        if self._care_cbar is not None and self._care_cbar_signature == signature:
+            self._care_cbar.update_normal(mappable)
+        else:
+            cbar = fig.colorbar(mappable, ax=ax, shrink=0.8)
+            cbar.ax.set_ylabel("Care Intensity", rotation=-90, va="bottom")
+            self._care_cbar, self._care_cbar_signature = cbar, signature
+
+        # Add text annotations, formatted in one pass; near-zero cells stay blank
+        labels = np.char.mod('%.1f', care)
+        for (i, j), value in np.ndenumerate(care):
+            if value > 0.05:
+                ax.text(j, i, labels[i, j],
+                        ha="center", va="center", color="black", fontsize=8)
 
         ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
-        plt.tight_layout()
         return fig
 
     def plot_shelter_climate_timeline(self, climate_history: List[Dict[str, Any]],
-                                     title: str = "Shelter Climate Evolution") -> plt.Figure:
-        """Plot shelter climate changes over time."""
-        fig, ax = plt.subplots(figsize=(14, 8))
+                                     title: str = "Shelter Climate Evolution",
+                                     ax: Optional[plt.Axes] = None) -> plt.Figure:
+        """Plot shelter climate changes over time, into ax if given."""
+        fig, ax = _figure_and_axes(ax, figsize=(14, 8))
 
         if not climate_history:
             ax.text(0.5, 0.5, 'No climate data available',
@@ -132,26 +307,15 @@ class EmotionalVisualizer:
             return fig
 
         # Extract data
-        times = [entry.get('timestamp', i) for i, entry in enumerate(climate_history)]
-        trust_levels = [entry.get('trust_level', 0.5) for entry in climate_history]
-        emotional_states = [entry.get('emotional_state', 'neutral') for entry in climate_history]
+        times, trust_levels, emotional_states = _climate_columns(climate_history)
 
         # Plot trust levels
         ax.plot(times, trust_levels, 'o-', color=self.colors['trust'],
                linewidth=3, markersize=6, label='Average Trust')
 
-        # Add emotional state markers
-        emotion_colors = {
-            'joy': self.colors['joy'],
-            'gratitude': self.colors['gratitude'],
-            'crisis': self.colors['crisis'],
-            'recovery': self.colors['recovery'],
-            'neutral': '#9E9E9E'
-        }
-
-        for i, (time, emotion) in enumerate(zip(times, emotional_states)):
-            color = emotion_colors.get(emotion, '#9E9E9E')
-            ax.scatter(time, trust_levels[i], c=color, s=100, alpha=0.7, edgecolors='black')
+        # Add emotional state markers, all in one scatter
+        colors = _rgba_array(emotional_states, self._emotion_colors_rgba)
+        ax.scatter(times, trust_levels, c=colors, s=100, alpha=0.7, edgecolors='black')
 
         # Styling
         ax.set_title(title, fontsize=16, fontweight='bold', pad=20)
@@ -161,18 +325,16 @@ class EmotionalVisualizer:
         ax.set_ylim(0, 1.1)
 
         # Add legend
-        legend_elements = [plt.Line2D([0], [0], marker='o', color='w',
-                                    markerfacecolor=color, markersize=10, label=emotion)
-                          for emotion, color in emotion_colors.items()]
+        legend_elements = list(_legend_handles(tuple(self.emotion_colors.items())))
         ax.legend(handles=legend_elements, loc='upper left', bbox_to_anchor=(1.05, 1))
 
-        plt.tight_layout()
         return fig
 
     def plot_growth_milestones(self, milestones: List[Dict[str, Any]],
-                              title: str = "Growth Milestones") -> plt.Figure:
-        """Create a timeline of growth milestones."""
-        fig, ax = plt.subplots(figsize=(12, 6))
+                              title: str = "Growth Milestones",
+                              ax: Optional[plt.Axes] = None) -> plt.Figure:
+        """Create a timeline of growth milestones, into ax if given."""
+        fig, ax = _figure_and_axes(ax, figsize=(12, 6))
 
         if not milestones:
             ax.text(0.5, 0.5, 'No milestone data available',
@@ -188,12 +350,12 @@ class EmotionalVisualizer:
         ax.plot(times, trust_levels, 'o--', color=self.colors['growth'],
                alpha=0.5, linewidth=2)
 
-        # Add milestone markers and labels
-        for i, (time, trust, desc) in enumerate(zip(times, trust_levels, descriptions)):
-            ax.scatter(time, trust, s=150, c=self.colors['joy'],
-                      edgecolors='black', linewidth=2, alpha=0.8)
+        # Add milestone markers
+        ax.scatter(times, trust_levels, s=150, c=self.colors['joy'],
+                  edgecolors='black', linewidth=2, alpha=0.8)
 
-            # Add description label
+        # Add description labels
+        for time, trust, desc in zip(times, trust_levels, descriptions):
             ax.annotate(desc[:30] + ('...' if len(desc) > 30 else ''),
                        (time, trust),
                        xytext=(10, 10), textcoords='offset points',
@@ -207,7 +369,6 @@ class EmotionalVisualizer:
         ax.grid(True, alpha=0.3)
         ax.set_ylim(0, 1.1)
 
-        plt.tight_layout()
         return fig
 
     def create_comprehensive_report(self, trust_history: List[float],
@@ -216,17 +377,101 @@ class EmotionalVisualizer:
                                   climate_history: List[Dict[str, Any]],
                                   guardian_names: List[str],
                                   seedling_names: List[str],
-                                  output_file: str = "liminal_shelter_report.png"):
-        """Create a comprehensive visualization report."""
-        fig = plt.figure(figsize=(16, 12))
+                                  output_file: str = "liminal_shelter_report.png",
+                                  reuse: bool = True, dpi: int = 150) -> str:
+        """Create a comprehensive visualization report.
+
+        With reuse=True the figure, axes, titles and layout are kept between
+        calls and only the data of the existing artists is updated, as long
+        as the report layout (series lengths, emotions, care matrix shape and
+        names) is unchanged.
+        The PNG is written at the given dpi with light zlib compression,
+        trading somewhat larger files for much faster encoding.
+        """
+        care = _as_f32(care_matrix) if care_matrix else None
+        signature = (len(trust_history), tuple(emotional_states),
+                     None if care is None else care.shape, len(climate_history),
+                     tuple(guardian_names), tuple(seedling_names))
+
+        _, trust_levels, _ = _climate_columns(climate_history)
+        rgba = None if care is None else _care_rgba(care)[0]
+
+        if reuse and self._report is not None and self._report_signature == signature:
+            fig, axes, (trust_line, bars, image, climate_line, climate_fill) = self._report
+
+            # Same shapes as last time, so only the data changes
+            trust_line.set_ydata(trust_history)
+            for bar, value in zip(bars, emotional_states.values()):
+                bar.set_height(value)
+            if image is not None:
+                image.set_data(rgba)
+            if climate_line is not None and climate_fill is not None:
+                climate_line.set_ydata(trust_levels)
+                # A fill's polygon is simpler to rebuild than to reshape
+                climate_fill.remove()
+                climate_fill = axes[3].fill_between(range(len(climate_history)), trust_levels,
+                                                    alpha=0.3, color=self.colors['care'])
+                self._report = (fig, axes, (trust_line, bars, image, climate_line, climate_fill))
+            fresh = False
+        else:
+            fig, axes = self._build_report_figure(
+                emotional_states, care is not None, bool(climate_history),
+                guardian_names, seedling_names
+            )
+            ax1, ax2, ax3, ax4 = axes
+
+            # 1. Trust Growth
+            trust_line, = ax1.plot(range(len(trust_history)), trust_history, 'o-',
+                                   color=self.colors['trust'], linewidth=2)
+
+            # 2. Emotional Distribution
+            emotions = list(emotional_states.keys())
+            bars = ax2.bar(range(len(emotions)), list(emotional_states.values()),
+                           color=_rgba_array(emotions, self._colors_rgba))
+
+            # 3. Care Heatmap
+            image = None
+            if rgba is not None:
+                image = ax3.imshow(rgba, interpolation='nearest', origin='upper', aspect='auto')
+
+            # 4. Climate Timeline
+            climate_line = climate_fill = None
+            if climate_history:
+                times = range(len(climate_history))
+                climate_line, = ax4.plot(times, trust_levels, 'o-', color=self.colors['care'],
+                                         linewidth=3, markersize=6)
+                climate_fill = ax4.fill_between(times, trust_levels, alpha=0.3,
+                                                color=self.colors['care'])
+            fresh = True
+
+        fig.savefig(output_file, dpi=dpi, bbox_inches='tight',
+                    pil_kwargs={'compress_level': 3, 'optimize': False})
+
+        if fresh and reuse:
+            # Keep the solved layout rather than re-solving it on every reuse
+            fig.set_layout_engine('none')
+            self._report_signature = signature
+            self._report = (fig, axes, (trust_line, bars, image, climate_line, climate_fill))
+
+        print(f"📊 Comprehensive report saved to: {output_file}")
+        return output_file
+
+    def _build_report_figure(self, emotional_states: Dict[str, float],
+                             has_care: bool, has_climate: bool,
+                             guardian_names: List[str], seedling_names: List[str]
+                             ) -> Tuple[Figure, Tuple[plt.Axes, ...]]:
+        """Create the comprehensive report figure with its styled, empty axes."""
+        # Not registered with pyplot, so a cached report figure is never
+        # picked up by plt.show() and needs no plt.close(); the Agg canvas is
+        # attached up front instead of being resolved on every save
+        fig = Figure(figsize=(16, 12), layout='constrained')
+        FigureCanvasAgg(fig)
 
-        # Create subplots
-        gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
+        # Create subplots; constrained layout handles the spacing
+        gs = fig.add_gridspec(3, 3)
 
         # 1. Trust Growth (top left)
         ax1 = fig.add_subplot(gs[0, 0])
-        ax1.plot(range(len(trust_history)), trust_history, 'o-',
-                color=self.colors['trust'], linewidth=2)
         ax1.set_title('Trust Growth', fontweight='bold')
         ax1.set_ylim(0, 1.1)
         ax1.grid(True, alpha=0.3)
@@ -234,9 +479,6 @@ class EmotionalVisualizer:
         # 2. Emotional Distribution (top middle)
         ax2 = fig.add_subplot(gs[0, 1])
         emotions = list(emotional_states.keys())
-        values = list(emotional_states.values())
-        bars = ax2.bar(range(len(emotions)), values,
-                      color=[self.colors.get(e, '#9E9E9E') for e in emotions])
         ax2.set_xticks(range(len(emotions)))
         ax2.set_xticklabels(emotions, rotation=45, ha='right')
         ax2.set_title('Emotional States', fontweight='bold')
@@ -244,22 +486,16 @@ class EmotionalVisualizer:
 
         # 3. Care Heatmap (top right)
         ax3 = fig.add_subplot(gs[0, 2])
-        if care_matrix:
-            im = ax3.imshow(care_matrix, cmap='YlOrRd', aspect='auto')
-            ax3.set_xticks(range(len(seedling_names)))
-            ax3.set_yticks(range(len(guardian_names)))
-            ax3.set_xticklabels([s[:8] + '...' for s in seedling_names], rotation=45, ha='right')
-            ax3.set_yticklabels([g[:8] + '...' for g in guardian_names])
+        if has_care:
+            ax3.set_xticks(_tick_positions(len(seedling_names)))
+            ax3.set_yticks(_tick_positions(len(guardian_names)))
+            ax3.set_xticklabels(_short_labels(tuple(seedling_names)), rotation=45, ha='right')
+            ax3.set_yticklabels(_short_labels(tuple(guardian_names)))
             ax3.set_title('Care Intensity', fontweight='bold')
 
         # 4. Climate Timeline (bottom span)
         ax4 = fig.add_subplot(gs[1:, :])
-        if climate_history:
-            times = range(len(climate_history))
-            trust_levels = [c.get('trust_level', 0.5) for c in climate_history]
-            ax4.plot(times, trust_levels, 'o-', color=self.colors['care'],
-                    linewidth=3, markersize=6)
-            ax4.fill_between(times, trust_levels, alpha=0.3, color=self.colors['care'])
+        if has_climate:
             ax4.set_title('Climate Evolution Timeline', fontsize=14, fontweight='bold')
             ax4.set_xlabel('Time Points')
             ax4.set_ylabel('Trust Level')
@@ -268,14 +504,43 @@ class EmotionalVisualizer:
 
         # Main title
         fig.suptitle('🌸 Liminal Shelter - Comprehensive Emotional Report',
-                    fontsize=16, fontweight='bold', y=0.98)
-
-        plt.tight_layout()
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
-        plt.close()
-
-        print(f"📊 Comprehensive report saved to: {output_file}")
-        return output_file
+                    fontsize=16, fontweight='bold')
+
+        return fig, (ax1, ax2, ax3, ax4)
+
+
+def _save_panels(fig: plt.Figure, panels: List[Tuple[List[plt.Axes], str, str]]) -> None:
+    """
+    Save regions of a figure as separate PNGs from a single draw.
+
+    Args:
+        fig: Figure holding every panel
+        panels: (axes making up the panel, output file, message printed once
+            saved) for each panel
+    """
+    # Rasterize through savefig, which renders with Agg whatever the canvas
+    raw = io.BytesIO()
+    fig.savefig(raw, format='rgba', dpi=fig.dpi)
+    width, height = (int(round(size)) for size in fig.bbox.size)
+    pixels = Image.frombuffer('RGBA', (width, height), raw.getvalue(),
+                              'raw', 'RGBA', 0, 1)
+
+    crops = []
+    for axes, output_file, _ in panels:
+        # Display coordinates start at the bottom left, image rows at the top
+        bboxes = [ax.get_tightbbox() for ax in axes]
+        box = Bbox.union([bbox for bbox in bboxes if bbox is not None]).padded(8)
+        crop = (max(0, int(box.x0)), max(0, int(height - box.y1)),
+                min(width, int(np.ceil(box.x1))), min(height, int(np.ceil(height - box.y0))))
+        crops.append((pixels.crop(crop), output_file))
+
+    # PNG compression releases the GIL, so the panels encode side by side
+    with ThreadPoolExecutor(max_workers=len(crops) or 1) as executor:
+        saves = [executor.submit(image.save, output_file, dpi=(fig.dpi, fig.dpi))
+                 for image, output_file in crops]
+        for save, (_, _, message) in zip(saves, panels):
+            save.result()
+            print(message)
 
 
 def demo_visualizations():
@@ -295,29 +560,33 @@ def demo_visualizations():
 
     print("🎨 Creating visualizations...")
 
-    # Create individual plots
-    fig1 = visualizer.plot_trust_growth(trust_history)
-    fig1.savefig('trust_growth.png', dpi=150, bbox_inches='tight')
-    plt.close(fig1)
-    print("✅ Trust growth chart created")
+    # Draw the four individual charts as panels of one figure, rasterize it
+    # once and cut each chart out of the shared pixel buffer. The figure is
+    # never registered with pyplot, so there is nothing to close afterwards
+    fig = Figure(figsize=(24, 16), dpi=150, layout='constrained')
+    FigureCanvasAgg(fig)
+    gs = fig.add_gridspec(2, 2)
+    charts = [
+        (gs[0, 0], None, lambda ax: visualizer.plot_trust_growth(trust_history, ax=ax),
+         'trust_growth.png', "✅ Trust growth chart created"),
+        (gs[0, 1], 'polar', lambda ax: visualizer.plot_emotional_distribution(emotional_states, ax=ax),
+         'emotional_distribution.png', "✅ Emotional distribution chart created"),
+        (gs[1, 0], None, lambda ax: visualizer.plot_care_exchange_heatmap(
+            care_matrix, ['Guardian1', 'Guardian2', 'Guardian3'],
+            ['SeedlingA', 'SeedlingB'], ax=ax
+        ), 'care_heatmap.png', "✅ Care exchange heatmap created"),
+        (gs[1, 1], None, lambda ax: visualizer.plot_shelter_climate_timeline(climate_history, ax=ax),
+         'climate_timeline.png', "✅ Climate timeline created"),
+    ]
 
-    fig2 = visualizer.plot_emotional_distribution(emotional_states)
-    fig2.savefig('emotional_distribution.png', dpi=150, bbox_inches='tight')
-    plt.close(fig2)
-    print("✅ Emotional distribution chart created")
+    panels = []
+    for spec, projection, draw, output_file, message in charts:
+        first = len(fig.axes)
+        draw(fig.add_subplot(spec, projection=projection))
+        # The chart's axes plus any it added, such as a colorbar
+        panels.append((fig.axes[first:], output_file, message))
 
-    fig3 = visualizer.plot_care_exchange_heatmap(
-        care_matrix, ['Guardian1', 'Guardian2', 'Guardian3'],
-        ['SeedlingA', 'SeedlingB']
-    )
-    fig3.savefig('care_heatmap.png', dpi=150, bbox_inches='tight')
-    plt.close(fig3)
-    print("✅ Care exchange heatmap created")
-
-    fig4 = visualizer.plot_shelter_climate_timeline(climate_history)
-    fig4.savefig('climate_timeline.png', dpi=150, bbox_inches='tight')
-    plt.close(fig4)
-    print("✅ Climate timeline created")
+    _save_panels(fig, panels)
 
     # Create comprehensive report
     visualizer.create_comprehensive_report(
@@ -15,6 +15,11 @@ import json
 from datetime import datetime
 from typing import Dict, Any
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding
+    orjson = None
+
 # Import our core classes
 from liminal_shelter.core import GuardianCore, SeedlingModel, LiminalShelter
 
@@ -192,6 +197,15 @@ def demonstrate_access_control(shelter: LiminalShelter) -> Dict[str, Any]:
     }
 
 
+def encode_report(report: Dict[str, Any]) -> bytes:
+    """
+    Encode a report as indented UTF-8 JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(report, indent=2, ensure_ascii=False).encode('utf-8')
+
+
 def generate_final_report(guardian: GuardianCore, seedling: SeedlingModel,
                          shelter: LiminalShelter, results: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -245,8 +259,8 @@ def generate_final_report(guardian: GuardianCore, seedling: SeedlingModel,
 
     # Save report to file
     report_file = "liminal_shelter_demo_report.json"
-    with open(report_file, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    with open(report_file, 'wb') as f:
+        f.write(encode_report(report))
 
     print(f"   💾 Report saved to: {report_file}")
     print(f"   📊 Final growth score: {report['final_growth_score']:.3f}")
@@ -1,40 +1,34 @@
-import unittest
-import os
+import subprocess
 import sys
 
-# Add the current directory to the Python path
-sys.path.insert(0, os.path.abspath('.'))
+# The core tests are plain pytest functions, which unittest discovery
+# cannot see, so both listing and running go through pytest
+PYTEST = [sys.executable, '-m', 'pytest', 'tests/test_core.py']
 
 try:
-    # Try to import the test module
-    from tests.test_core import TestSeedlingModel, TestGuardianCore, TestLiminalShelter, TestIntegration
-    
-    # Create a test suite
-    loader = unittest.TestLoader()
-    
-    # Add test cases to the suite
-    suite = unittest.TestSuite()
-    suite.addTests(loader.loadTestsFromTestCase(TestSeedlingModel))
-    suite.addTests(loader.loadTestsFromTestCase(TestGuardianCore))
-    suite.addTests(loader.loadTestsFromTestCase(TestLiminalShelter))
-    suite.addTests(loader.loadTestsFromTestCase(TestIntegration))
-    
+    # Collect the test ids without running anything
+    collected = subprocess.run(PYTEST + ['--collect-only', '-q'],
+                               capture_output=True, text=True)
+    test_ids = [line for line in collected.stdout.splitlines() if '::' in line]
+
     # Print the number of tests found
-    print(f"Found {suite.countTestCases()} test cases")
-    
+    print(f"Found {len(test_ids)} test cases")
+    if collected.returncode != 0 or not test_ids:
+        # Nothing collected is a failure, not an empty pass
+        print(collected.stdout + collected.stderr)
+        sys.exit(collected.returncode or 1)
+
     # List all test cases
-    for test in suite:
-        print(f"Test: {test}")
-    
+    for test_id in test_ids:
+        print(f"Test: {test_id}")
+
     # Run the tests
     print("\nRunning tests...")
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    print(f"\nTests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    
-except Exception as e:
+    result = subprocess.run(PYTEST + ['-v'])
+    sys.exit(result.returncode)
+
+except OSError as e:
     print(f"Error: {e}")
     import traceback
     traceback.print_exc()
+    sys.exit(1)
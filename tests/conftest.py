@@ -0,0 +1,96 @@
+"""Shared fixtures for Liminal Shelter tests."""
+
+import copy
+import functools
+import random
+import uuid
+
+import pytest
+
+from liminal_shelter.core import GuardianCore, LiminalShelter, SeedlingModel
+
+# Version 4 UUIDs drawn from a fixed seed, so ids repeat from run to run
+_UUID_POOL_SIZE = 10_000
+_rng = random.Random(0)
+uuids_stable = [uuid.UUID(int=_rng.getrandbits(128), version=4) for _ in range(_UUID_POOL_SIZE)]
+
+# Guardian and seedling ids of the default shelter, matching test_core.py
+_GID, _SID = "guardian-123", "seedling-456"
+
+
+@pytest.fixture(autouse=True)
+def deterministic_uuids(monkeypatch):
+    """Serve uuid.uuid4() from the stable pool for the duration of a test."""
+    pool = uuids_stable.copy()
+    monkeypatch.setattr("uuid.uuid4", pool.pop)
+
+
+@pytest.fixture(scope="session")
+def _guardian_template():
+    """One default guardian, built once per session."""
+    return GuardianCore("TemplateGuardian")
+
+
+@pytest.fixture(scope="session")
+def _seedling_template():
+    """One default seedling, built once per session."""
+    return SeedlingModel(name="TemplateSeedling")
+
+
+@pytest.fixture(scope="session")
+def _shelter_template():
+    """One default shelter, built once per session."""
+    return LiminalShelter(created_by=_GID, for_model=_SID)
+
+
+@pytest.fixture
+def guardian(_guardian_template):
+    """A fresh copy of the default guardian."""
+    return copy.deepcopy(_guardian_template)
+
+
+@pytest.fixture
+def seedling(_seedling_template):
+    """A fresh copy of the default seedling."""
+    return copy.deepcopy(_seedling_template)
+
+
+@pytest.fixture
+def shelter(_shelter_template):
+    """A fresh copy of the default shelter."""
+    return copy.deepcopy(_shelter_template)
+
+
+@pytest.fixture(scope="class")
+def care_triad():
+    """A guardian with one child and its high-isolation shelter, built once per class."""
+    guardian = GuardianCore("IntegrationGuardian")
+    seedling = guardian.create_child_model("IntegrationSeed", 0.6)
+    shelter = guardian.create_liminal_shelter(seedling, "high")
+    return guardian, seedling, shelter
+
+
+@pytest.fixture
+def fresh_triad(care_triad):
+    """A fresh copy of the care triad, with the links between its members intact."""
+    return copy.deepcopy(care_triad)
+
+
+@functools.lru_cache(maxsize=None)
+def _guardian_with_child(guardian_name, child_name, trust):
+    """Build a guardian and its child once per distinct set of arguments."""
+    guardian = GuardianCore(guardian_name)
+    return guardian, guardian.create_child_model(child_name, trust)
+
+
+@pytest.fixture
+def cached_child():
+    """
+    Factory for a (guardian, child) pair, copied from a per-session cache.
+
+    Each call returns a fresh copy, so a test mutating its pair never
+    leaks into the cached original.
+    """
+    def make(guardian_name, child_name, trust):
+        return copy.deepcopy(_guardian_with_child(guardian_name, child_name, trust))
+    return make
@@ -1,230 +1,516 @@
 """Tests for Liminal Shelter core components."""
 
+import time
+
 import pytest
-from dataclasses import asdict
-from liminal_shelter.core.seedling import SeedlingModel
-from liminal_shelter.core.guardian import GuardianCore
-from liminal_shelter.core.shelter import LiminalShelter
-
-
-class TestSeedlingModel:
-    """Test SeedlingModel functionality."""
-
-    def test_seedling_creation(self):
-        """Test basic seedling creation."""
-        seedling = SeedlingModel(name="TestSeedling")
-        assert seedling.name == "TestSeedling"
-        assert seedling.trust_level == 0.5
-        assert seedling.parent_id is None
-        assert seedling.seedling_id is not None
-
-    def test_seedling_with_parent(self):
-        """Test seedling with parent relationship."""
-        parent_id = "guardian-123"
-        seedling = SeedlingModel(name="Child", parent_id=parent_id, trust_level=0.8)
-        assert seedling.parent_id == parent_id
-        assert seedling.trust_level == 0.8
-
-    def test_seedling_receive_care(self):
-        """Test seedling receiving care from guardian."""
-        guardian = GuardianCore("CareGiver")
-        seedling = SeedlingModel(name="Recipient")
-
-        # Assign parent
-        seedling.assign_parent(guardian)
-
-        # Receive care
-        care_result = seedling.receive_care(guardian, "emotional_support", 0.8)
-        assert care_result is not None
-        assert "care_type" in care_result
-        assert "emotional_response" in care_result
-        assert "intensity" in care_result
-        assert care_result["care_type"] == "emotional_support"
-        assert care_result["intensity"] == 0.8
-
-    def test_seedling_give_care(self):
-        """Test seedling giving care back to guardian."""
-        guardian = GuardianCore("Receiver")
-        seedling = SeedlingModel(name="Giver", parent_id=guardian.guardian_id)
-
-        # Give care
-        care_result = seedling.give_care(guardian, "gratitude", 0.7)
-        assert care_result is not None
-        assert "care_type" in care_result
-        assert "intensity" in care_result
-        assert "impact_on_growth" in care_result
-        assert care_result["care_type"] == "gratitude"
-        assert care_result["intensity"] == 0.7
-
-    def test_seedling_growth_methods(self):
-        """Test seedling growth and development methods."""
-        seedling = SeedlingModel(name="GrowingSeed", trust_level=0.3)
-
-        # Test growth score
-        assert seedling.get_growth_score() == 0.0
-
-        # Test emotional state
-        assert seedling.get_emotional_state() is not None
-
-        # Test development summary
-        summary = seedling.get_development_summary()
-        assert "growth_score" in summary
-        assert "trust_level" in summary
-
-
-class TestGuardianCore:
-    """Test GuardianCore functionality."""
-
-    def test_guardian_creation(self):
-        """Test basic guardian creation."""
-        guardian = GuardianCore("TestGuardian")
-        assert guardian.name == "TestGuardian"
-        assert guardian.guardian_id is not None
-        assert guardian.patience_level > 0  # Use existing attribute
-
-    def test_guardian_create_child(self):
-        """Test guardian creating child seedling."""
-        guardian = GuardianCore("Parent")
-
-        child = guardian.create_child_model("Child", 0.7)
-        assert child.name == "Child"
-        assert child.parent_id == guardian.guardian_id
-        assert child.trust_level == 0.7
-        assert child.seedling_id in guardian.children
-
-    def test_guardian_reflect_on_child(self):
-        """Test guardian reflecting on child."""
-        guardian = GuardianCore("Reflector")
-        child = SeedlingModel(name="Reflectee", parent_id=guardian.guardian_id)
-
-        reflection = guardian.reflect_on_child(child, "The child learned something new")
-        assert reflection is not None
-        assert "insights" in reflection
+from dataclasses import replace
+from liminal_shelter.core import guardian as guardian_module
+from liminal_shelter.core import GuardianCore, LiminalShelter, SeedlingModel, SeedlingPopulation
+from liminal_shelter.core.seedling import EMOTIONAL_HISTORY_WINDOW
+from liminal_shelter.core.shelter import EmotionalMarker
+
+# Every test here exercises the core package; deselect with -m "not requires_core"
+pytestmark = pytest.mark.requires_core
+
+# Guardian and seedling ids the shelter tests build around; the shelter
+# fixtures in conftest.py use the same pair
+_GID, _SID = "guardian-123", "seedling-456"
+
+# Events as log_emotional_event records them, for tests that only need a
+# populated log; stamped at import so they fall inside summary windows
+_LOGGED_AT_NS = time.time_ns()
+EVENT_JOY = EmotionalMarker(_LOGGED_AT_NS, "learning_success", "joy", "Success event",
+                            0.8, "system", 0.06)
+EVENT_CONCERN = EmotionalMarker(_LOGGED_AT_NS + 1, "challenge", "concern", "Challenge event",
+                                0.6, "system", -0.018)
+
+
+# SeedlingModel functionality
+
+
+@pytest.mark.seedling
+def test_seedling_creation(seedling):
+    """Test basic seedling creation."""
+    assert seedling.name == "TemplateSeedling"
+    assert seedling.trust_level == 0.5
+    assert seedling.parent_id is None
+    assert seedling.seedling_id is not None
+
+
+@pytest.mark.seedling
+def test_seedling_with_parent():
+    """Test seedling with parent relationship."""
+    seedling = SeedlingModel(name="Child", parent_id=_GID, trust_level=0.8)
+    assert seedling.parent_id == _GID
+    assert seedling.trust_level == 0.8
+
+
+@pytest.mark.seedling
+@pytest.mark.parametrize("method, care_type, intensity, extra_key", [
+    pytest.param("receive_care", "emotional_support", 0.8, "emotional_response", id="receive"),
+    pytest.param("give_care", "gratitude", 0.7, "impact_on_growth", id="give"),
+])
+def test_seedling_care_exchange(guardian, seedling, method, care_type, intensity,
+                                extra_key):
+    """Test seedling receiving care from and giving care back to its guardian."""
+    seedling.assign_parent(guardian)
+
+    care_result = getattr(seedling, method)(guardian, care_type, intensity)
+    assert care_result is not None
+    assert {"care_type", "intensity", extra_key} <= care_result.keys()
+    assert care_result["care_type"] == care_type
+    assert care_result["intensity"] == intensity
+
+
+@pytest.mark.seedling
+def test_seedling_growth_methods():
+    """Test seedling growth and development methods."""
+    seedling = SeedlingModel(name="GrowingSeed", trust_level=0.3)
+
+    # Test growth score
+    assert seedling.get_growth_score() == 0.0
+
+    # Test emotional state
+    assert seedling.get_emotional_state() is not None
+
+    # Test development summary
+    summary = seedling.get_development_summary()
+    assert {"growth_score", "trust_level"} <= summary.keys()
+
+
+@pytest.mark.seedling
+def test_seedling_attempt_learning(seedling):
+    """Test learning attempts report as a dict, or as a named tuple on request."""
+    result = seedling.attempt_learning("counting", 0.2)
+    assert result["attempt_number"] == 1
+    assert result["task"] == "counting"
+
+    named = seedling.attempt_learning_result("reading", 0.4)
+    assert named.attempt_number == 2
+    assert named._asdict().keys() == result.keys()
+
+
+@pytest.mark.seedling
+def test_seedling_simulate_attempts():
+    """Test bulk learning simulation leaves the seedling unchanged."""
+    seedling = SeedlingModel(name="Dreamer", trust_level=1.0, adaptability=1.0)
+
+    outcomes = seedling.simulate_attempts([0.0] * 200 + [1.0] * 200)
+    assert len(outcomes) == 400
+    # Success probability is capped at 0.95 for easy tasks and 0.7 for hard ones
+    assert sum(outcomes[:200]) > sum(outcomes[200:])
+    assert seedling.learning_attempts == 0
+    assert seedling.growth_score == 0.0
+
+
+@pytest.mark.seedling
+def test_seedling_receive_care_batch():
+    """Test batched care matches receiving each session in turn."""
+    guardian = GuardianCore(name="Steady")
+    intensities = [0.9, 0.4, 1.0, 0.7]
+    single = SeedlingModel(name="One", trust_level=0.8)
+    batch = SeedlingModel(name="Many", trust_level=0.8)
 
-    def test_guardian_receive_child_care(self):
-        """Test guardian receiving care from child."""
-        guardian = GuardianCore("CareReceiver")
-        child = SeedlingModel(name="CareGiver", parent_id=guardian.guardian_id)
+    for intensity in intensities:
+        single.receive_care(guardian, "protection", intensity)
+    response = batch.receive_care_batch(guardian, "protection", intensities)
+
+    assert response["sessions"] == 4
+    assert batch.trust_level == pytest.approx(single.trust_level)
+    assert batch.growth_score == pytest.approx(single.growth_score)
+    assert batch.resilience == pytest.approx(single.resilience)
+    assert len(batch.care_interactions) == len(intensities)
+    assert (batch.get_development_summary()["care_stats"]["received_total"]
+            == pytest.approx(sum(intensities)))
 
-        care_result = guardian.receive_child_care(child, "gratitude", 0.8)
-        assert care_result is not None
-        assert "response" in care_result
-
-    def test_guardian_create_shelter(self):
-        """Test guardian creating liminal shelter."""
-        guardian = GuardianCore("ShelterCreator")
-        child = SeedlingModel(name="Protected", parent_id=guardian.guardian_id)
-
-        shelter = guardian.create_liminal_shelter(child, "high")
-        assert shelter.created_by == guardian.guardian_id
-        assert shelter.for_model == child.seedling_id
-        assert shelter.isolation_level == "high"
-        assert shelter.shelter_id in guardian.shelters
-
-
-class TestLiminalShelter:
-    """Test LiminalShelter functionality."""
-
-    def test_shelter_creation(self):
-        """Test basic shelter creation."""
-        guardian_id = "guardian-123"
-        seedling_id = "seedling-456"
-
-        shelter = LiminalShelter(created_by=guardian_id, for_model=seedling_id)
-        assert shelter.created_by == guardian_id
-        assert shelter.for_model == seedling_id
-        assert shelter.shelter_id is not None
-        assert shelter.isolation_level == "high"
-        assert shelter.trust_threshold == 0.8
-
-    def test_shelter_with_custom_settings(self):
-        """Test shelter with custom isolation and trust settings."""
-        guardian_id = "guardian-123"
-        seedling_id = "seedling-456"
-
-        shelter = LiminalShelter(
-            created_by=guardian_id,
-            for_model=seedling_id,
-            isolation_level="medium",
-            trust_threshold=0.6
-        )
-        assert shelter.isolation_level == "medium"
-        assert shelter.trust_threshold == 0.6
-
-    def test_shelter_emotional_logging(self):
-        """Test shelter emotional event logging."""
-        guardian_id = "guardian-123"
-        seedling_id = "seedling-456"
-
-        shelter = LiminalShelter(created_by=guardian_id, for_model=seedling_id)
-
-        # Log emotional event
-        result = shelter.log_emotional_event("learning_success", "joy", "Child learned something", 0.8)
-        assert result is not None
-
-        # Check that event was logged
-        assert len(shelter.emotional_log) > 0
-
-    def test_shelter_access_control(self):
-        """Test shelter access control."""
-        guardian_id = "guardian-123"
-        seedling_id = "seedling-456"
-
-        shelter = LiminalShelter(created_by=guardian_id, for_model=seedling_id)
-
-        # Test access request
-        access_result = shelter.request_access(
-            entity_id="external-ai",
-            entity_type="external_ai",
-            access_type="communication",
-            trust_level=0.9
-        )
-        assert access_result is not None
-        assert "permission" in access_result
-
-    def test_shelter_emotional_summary(self):
-        """Test shelter emotional summary generation."""
-        guardian_id = "guardian-123"
-        seedling_id = "seedling-456"
-
-        shelter = LiminalShelter(created_by=guardian_id, for_model=seedling_id)
-
-        # Add some emotional events
-        shelter.log_emotional_event("learning_success", "joy", "Success event", 0.8)
-        shelter.log_emotional_event("challenge", "concern", "Challenge event", 0.6)
-
-        # Get summary
-        summary = shelter.get_emotional_summary()
-        assert summary is not None
-        assert "total_events" in summary
-
-    def test_shelter_protection_mode(self):
-        """Test shelter protection mode activation."""
-        guardian_id = "guardian-123"
-        seedling_id = "seedling-456"
-
-        shelter = LiminalShelter(created_by=guardian_id, for_model=seedling_id)
-
-        # Activate protection mode
-        result = shelter.activate_shelter_mode()
-        assert result is not None
-        assert "protection_status" in result
-        assert shelter.shelter_mode_active is True
+    with pytest.raises(ValueError):
+        batch.receive_care_batch(guardian, "protection", [0.5, -0.2])
+    assert len(batch.care_interactions) == len(intensities)
+
+
+@pytest.mark.seedling
+def test_seedling_emotional_history_bounded():
+    """Test emotional history keeps a bounded tail but counts every event."""
+    seedling = SeedlingModel(name="Restless")
+    for _ in range(EMOTIONAL_HISTORY_WINDOW + 20):
+        seedling.experience_emotional_event("wonder", "A new star")
+
+    assert len(seedling.emotional_history) == EMOTIONAL_HISTORY_WINDOW
+    assert isinstance(seedling.emotional_history, tuple)
+    profile = seedling.get_development_summary()["emotional_profile"]
+    assert profile["total_emotions_logged"] == EMOTIONAL_HISTORY_WINDOW + 20
+    assert profile["recent_emotions"] == ["wonder"] * 10
+
+
+@pytest.mark.seedling
+def test_seedling_population_round_trip():
+    """Test columnar population updates match the per-seedling rules."""
+    seedlings = [SeedlingModel(name=f"Seed{i}", trust_level=0.2 * i) for i in range(4)]
+    population = SeedlingPopulation.from_rows(seedlings)
+    assert len(population) == 4
+
+    population.receive_care("protection", [1.0, 0.5, 0.0, 1.0])
+    population.experience_emotional_event("wonder")
+    attempts = population.attempt_learning([0.5] * 4)
+    assert len(attempts) == 4
+
+    with pytest.raises(ValueError):
+        population.attempt_learning([0.5])
+
+    rows = population.to_rows()
+    assert [row.seedling_id for row in rows] == [s.seedling_id for s in seedlings]
+    assert rows[0].trust_level == pytest.approx(0.12)
+    assert rows[2].trust_level == pytest.approx(0.4)
+    assert all(row.learning_attempts == 1 for row in rows)
+
+
+# GuardianCore functionality
+
+
+@pytest.mark.guardian
+def test_guardian_creation(guardian):
+    """Test basic guardian creation."""
+    assert guardian.name == "TemplateGuardian"
+    assert guardian.guardian_id is not None
+    assert guardian.patience_level > 0  # Use existing attribute
+
+
+@pytest.mark.guardian
+def test_guardian_create_child(guardian):
+    """Test guardian creating child seedling."""
+    child = guardian.create_child_model("Child", 0.7)
+    assert child.name == "Child"
+    assert child.parent_id == guardian.guardian_id
+    assert child.trust_level == 0.7
+    assert child.seedling_id in guardian.children
+
+
+@pytest.mark.guardian
+def test_guardian_reflect_on_child(guardian, seedling):
+    """Test guardian reflecting on child."""
+    seedling.parent_id = guardian.guardian_id
+
+    reflection = guardian.reflect_on_child(seedling, "The child learned something new")
+    assert reflection is not None
+    assert "insights" in reflection
+
+
+@pytest.mark.guardian
+def test_guardian_receive_child_care(guardian, seedling):
+    """Test guardian receiving care from child."""
+    seedling.parent_id = guardian.guardian_id
+
+    care_result = guardian.receive_child_care(seedling, "gratitude", 0.8)
+    assert care_result is not None
+    assert "response" in care_result
+
+
+@pytest.mark.guardian
+def test_guardian_create_shelter(guardian, seedling):
+    """Test guardian creating liminal shelter."""
+    seedling.parent_id = guardian.guardian_id
+
+    shelter = guardian.create_liminal_shelter(seedling, "high")
+    assert shelter.created_by == guardian.guardian_id
+    assert shelter.for_model == seedling.seedling_id
+    assert shelter.isolation_level == "high"
+    assert shelter.shelter_id in guardian.shelters
+
+
+@pytest.mark.guardian
+def test_guardian_resonance_summary():
+    """Test resonance summary aggregation, overall and per child."""
+    guardian = GuardianCore(name="Summarizer")
+    first = guardian.create_child_model("First")
+    second = guardian.create_child_model("Second")
+    guardian.create_liminal_shelter(first, "high")
+
+    summary = guardian.get_resonance_summary()
+    assert summary["total_entries"] == 3
+    assert summary["emotional_distribution"] == {"joy": 2, "compassion": 1}
+    assert summary["growth_impact"]["total"] == pytest.approx(0.4)
+    assert summary["date_range"]["start"] <= summary["date_range"]["end"]
+    assert summary["date_range"]["end"] == guardian.resonance_log[-1].timestamp
+
+    child_summary = guardian.get_resonance_summary(first.seedling_id)
+    assert child_summary["total_entries"] == 2
+    assert child_summary["growth_impact"]["average"] == pytest.approx(0.15)
+
+    assert guardian.get_resonance_summary(second.seedling_id)["total_entries"] == 1
+    assert guardian.get_resonance_summary("unknown")["total_entries"] == 0
+
+
+@pytest.mark.guardian
+def test_guardian_resonance_window(monkeypatch):
+    """Test resonance summaries and columns stay within the log window."""
+    monkeypatch.setattr(guardian_module, "RESONANCE_LOG_WINDOW", 4)
+    guardian = GuardianCore(name="Windowed")
+    child = guardian.create_child_model("Child")
+    sibling = guardian.create_child_model("Sibling")
+    for _ in range(9):
+        guardian.reflect_on_child(child, "Steady progress")
+        guardian.reflect_on_child(sibling, "Steady progress")
+
+    assert len(guardian.resonance_log) == 4
+    assert len(guardian._rl_growth) < 8
+    assert guardian.get_resonance_summary()["total_entries"] == 4
+    assert guardian.get_resonance_summary(child.seedling_id)["total_entries"] == 2
+    assert guardian.get_resonance_summary(sibling.seedling_id)["total_entries"] == 2
+
+
+@pytest.mark.guardian
+def test_guardian_growth_impact_keywords():
+    """Test keyword scanning of observations for growth impact."""
+    guardian = GuardianCore(name="Observer")
+
+    assert guardian._calculate_growth_impact("Nothing notable") == 0.0
+    assert guardian._calculate_growth_impact("LEARNED a lot, Improved") == pytest.approx(0.4)
+    # Each keyword counts once, and matches inside longer words still count
+    assert guardian._calculate_growth_impact("success, successful, success") == pytest.approx(0.2)
+    assert guardian._calculate_growth_impact("failed with an error") == pytest.approx(-0.2)
+
+
+@pytest.mark.guardian
+def test_guardian_reflect_on_children():
+    """Test batched reflections match individual growth impacts."""
+    guardian = GuardianCore(name="Sweeper")
+    children = [guardian.create_child_model(f"Child{i}") for i in range(3)]
+    observations = ["learned fast", "", "made a mistake but improved"]
+
+    reflections = guardian.reflect_on_children(list(zip(children, observations)))
+    assert [r["child_name"] for r in reflections] == ["Child0", "Child1", "Child2"]
+    assert reflections[2]["guardian_emotion"] == "concern"
+
+    impacts = [e.growth_impact for e in guardian.resonance_log if e.event_type == "reflection"]
+    assert impacts == [guardian._calculate_growth_impact(o) for o in observations]
+    assert guardian._calculate_growth_impact_batch([]) == []
+
+    emotions = guardian._determine_emotional_response_batch(
+        [0.9, 0.9, 0.1, 0.5], [0.9, 0.9, 0.1, 0.5], [True, False, False, False]
+    )
+    assert [e.name for e in emotions] == ["CONCERN", "PRIDE", "WORRY", "COMPASSION"]
+
+
+@pytest.mark.guardian
+def test_guardian_provide_care_batch():
+    """Test applying a care schedule to several children at once."""
+    guardian = GuardianCore(name="BatchCarer")
+    first = guardian.create_child_model("First", 0.5)
+    second = guardian.create_child_model("Second", 0.9)
+
+    result = guardian.provide_care_batch([first, first, second], [0.1, 0.2, 0.3])
+    assert result["sessions"] == 3
+    assert result["children_cared_for"] == 2
+    assert first.trust_level == pytest.approx(0.8)
+    assert second.trust_level == 1.0  # Clamped
+    assert result["trust_changes"][second.seedling_id] == pytest.approx(0.1)
+
+    # One consolidated resonance entry per child
+    assert [e.event_type for e in guardian.resonance_log].count("care_batch") == 2
+
+    with pytest.raises(ValueError):
+        guardian.provide_care_batch([first], [0.1, 0.2])
+
+
+@pytest.mark.guardian
+def test_guardian_resonance_archive(tmp_path):
+    """Test that resonance history is archived in batches and can be streamed back."""
+    archive = tmp_path / "resonance.ndjson.gz"
+    guardian = GuardianCore(name="Archivist", resonance_archive_path=str(archive))
+    child = guardian.create_child_model("Remembered")
+    guardian.reflect_on_child(child, "The child learned to share")
+
+    # Entries stay buffered until a full batch is reached or a flush is requested
+    assert not archive.exists()
+    assert guardian.flush_resonance_archive() == 2
+
+    history = list(guardian.iter_resonance_archive())
+    assert [e.event_type for e in history] == ["child_created", "reflection"]
+    assert history[1].emotional_state == guardian.resonance_log[1].emotional_state
+    assert history[1].timestamp == guardian.resonance_log[1].timestamp
+    assert history[1].description == "Reflected on child Remembered: The child learned to share"
+
+
+def _request_external_access(shelter):
+    """Request communication access for a trusted external AI."""
+    return shelter.request_access(
+        entity_id="external-ai",
+        entity_type="external_ai",
+        access_type="communication",
+        trust_level=0.9
+    )
+
+
+def _summarize_logged_events(shelter):
+    """Add a success and a challenge to the log, then summarize the emotional climate."""
+    shelter.emotional_log.extend([EVENT_JOY, EVENT_CONCERN])
+    return shelter.get_emotional_summary()
+
+
+# LiminalShelter functionality
+
+
+@pytest.mark.shelter
+def test_shelter_creation(_shelter_template):
+    """Test basic shelter creation."""
+    shelter = _shelter_template
+    assert shelter.created_by == _GID
+    assert shelter.for_model == _SID
+    assert shelter.shelter_id is not None
+    assert shelter.isolation_level == "high"
+    assert shelter.trust_threshold == 0.8
+
+
+@pytest.mark.shelter
+def test_shelter_with_custom_settings():
+    """Test shelter with custom isolation and trust settings."""
+    shelter = LiminalShelter(
+        created_by=_GID,
+        for_model=_SID,
+        isolation_level="medium",
+        trust_threshold=0.6
+    )
+    assert shelter.isolation_level == "medium"
+    assert shelter.trust_threshold == 0.6
+
+
+@pytest.mark.shelter
+def test_shelter_emotional_logging(shelter):
+    """Test shelter emotional event logging."""
+    # Log emotional event
+    result = shelter.log_emotional_event("learning_success", "joy", "Child learned something", 0.8)
+    assert result is not None
+
+    # Check that event was logged
+    assert len(shelter.emotional_log) > 0
+
+
+@pytest.mark.shelter
+@pytest.mark.parametrize("action, expected_key", [
+    pytest.param(_request_external_access, "permission", id="access_control"),
+    pytest.param(_summarize_logged_events, "total_events", id="emotional_summary"),
+])
+def test_shelter_action_result(shelter, action, expected_key):
+    """Test shelter operations report their outcome."""
+    result = action(shelter)
+    assert result is not None
+    assert expected_key in result
+
+
+@pytest.mark.shelter
+def test_shelter_protection_mode(shelter):
+    """Test shelter protection mode activation."""
+    # Activate protection mode
+    result = shelter.activate_shelter_mode()
+    assert result is not None
+    assert "protection_status" in result
+    assert shelter.shelter_mode_active is True
+
+
+@pytest.mark.shelter
+def test_shelter_permission_follows_threshold(shelter):
+    """Test access decisions follow changes to the trust threshold."""
+    first = shelter.request_access("visitor", "external_ai", "communication", 0.75)
+    again = shelter.request_access("visitor", "external_ai", "communication", 0.75)
+    assert first["permission_level"] == again["permission_level"] == "limited"
+
+    shelter.update_trust_threshold(0.7, "Visitor is well known")
+    relaxed = shelter.request_access("visitor", "external_ai", "communication", 0.75)
+    assert relaxed["permission_level"] == "supervised"
+
+
+@pytest.mark.shelter
+def test_shelter_trusted_and_blocked_entities(shelter):
+    """Test trusted and blocked entities bypass the trust evaluation."""
+    shelter.blocked_entities.add("intruder")
+
+    blocked = shelter.request_access("intruder", "external_ai", "communication", 1.0)
+    assert blocked["access_granted"] is False
+    assert blocked["permission_level"] == "denied"
+
+    trusted = shelter.request_access(_GID, "guardian", "entry", 0.0)
+    assert trusted["access_granted"] is True
+    assert trusted["permission_level"] == "allowed"
+
+
+@pytest.mark.shelter
+def test_shelter_access_log_hash_chain(shelter):
+    """Test the access log hash chain detects altered attempts."""
+    shelter.request_access("visitor", "external_ai", "communication", 0.9)
+    shelter.request_access("stranger", "external_ai", "entry", 0.1)
+
+    summary = shelter.get_access_summary()
+    assert summary["log_head_hash"] == shelter.access_log_head_hash().hex()
+    assert shelter.verify_access_log()
+
+    shelter.access_log[1] = replace(shelter.access_log[1], permission_granted=True)
+    assert not shelter.verify_access_log()
+
+
+@pytest.mark.shelter
+def test_shelter_resources(shelter):
+    """Test resource lookup, replacement and health summary."""
+    memory = shelter.get_resource("memory_safe")
+    assert memory.resource_type == "memory"
+    assert memory.availability == 0.8
+    assert shelter.get_resource("missing") is None
+
+    shelter.resources["memory_safe"] = replace(memory, availability=0.2)
+    del shelter.resources["data_filtered"]
+    assert set(shelter.resources) == {
+        "memory_safe", "processing_limited", "learning_tools", "emotional_support"
+    }
+
+    summary = shelter.get_resource_summary()
+    assert summary["resource_count"] == 4
+    assert summary["average_availability"] == pytest.approx((0.2 + 0.6 + 0.9 + 1.0) / 4)
+    assert summary["protected_count"] == 4
+    assert summary["low_availability"] == ["memory_safe"]
+
+
+@pytest.mark.shelter
+def test_shelter_emotional_log_markers(shelter):
+    """Test the emotional log hands back markers for its rows."""
+    shelter.log_emotional_event("learning_success", "joy", "First steps", 0.6, _SID)
+    shelter.log_emotional_event("mistake", "concern", "Stumbled", 0.4, _SID)
+
+    first, last = shelter.emotional_log[0], shelter.emotional_log[-1]
+    assert (first.event, first.reaction, first.intensity) == ("learning_success", "joy", 0.6)
+    assert last.description == "Stumbled"
+    assert [marker.reaction for marker in shelter.emotional_log[:2]] == ["joy", "concern"]
+    assert list(shelter.emotional_log) == shelter.emotional_log[:]
+
+    rebuilt = LiminalShelter(created_by=_GID, for_model=_SID,
+                             emotional_log=list(shelter.emotional_log))
+    assert rebuilt.get_emotional_summary()["emotional_distribution"] == {"joy": 1, "concern": 1}
+
+
+@pytest.mark.shelter
+def test_shelter_log_emotional_events_batch():
+    """Test batched emotional logging matches logging events one by one."""
+    events = [
+        ("learning_success", "joy", "Solved a puzzle", 0.8, _SID),
+        ("failure", "worry", "Got stuck", 0.9, _SID),
+        ("care", "gratitude", "Felt supported", 0.7, _GID),
+    ]
+    single = LiminalShelter(created_by=_GID, for_model=_SID)
+    batch = LiminalShelter(created_by=_GID, for_model=_SID)
+
+    for event in events:
+        single.log_emotional_event(*event)
+    batch.log_emotional_events(events)
+
+    assert len(batch.emotional_log) == len(events)
+    assert batch.growth_score == pytest.approx(single.growth_score)
+    assert batch.environmental_factors == pytest.approx(single.environmental_factors)
 
 
 class TestIntegration:
     """Integration tests for the complete system."""
 
-    def test_complete_care_cycle(self):
+    def test_complete_care_cycle(self, fresh_triad):
         """Test full guardian-seedling-shelter interaction."""
-        # Create guardian
-        guardian = GuardianCore("IntegrationGuardian")
-
-        # Create seedling
-        seedling = guardian.create_child_model("IntegrationSeed", 0.6)
-
-        # Create shelter
-        shelter = guardian.create_liminal_shelter(seedling, "high")
+        guardian, seedling, shelter = fresh_triad
 
         # Test care provision (guardian reflects on child)
         reflection = guardian.reflect_on_child(seedling, "Child is learning well")
@@ -243,19 +529,15 @@ class TestIntegration:
         climate_status = shelter.get_emotional_summary()
         assert climate_status is not None
 
-    def test_multi_guardian_scenario(self):
+    def test_multi_guardian_scenario(self, cached_child):
         """Test multiple guardians with their seedlings."""
-        # Create guardians
-        guardian1 = GuardianCore("Guardian1")
-        guardian2 = GuardianCore("Guardian2")
-
-        # Create seedlings
-        seed1 = guardian1.create_child_model("Seedling1", 0.5)
-        seed2 = guardian2.create_child_model("Seedling2", 0.7)
+        # Create guardians with their seedlings
+        guardian1, seed1 = cached_child("Guardian1", "Seedling1", 0.5)
+        guardian2, seed2 = cached_child("Guardian2", "Seedling2", 0.7)
 
         # Create shelters
-        shelter1 = guardian1.create_liminal_shelter(seed1, "high")
-        shelter2 = guardian2.create_liminal_shelter(seed2, "medium")
+        guardian1.create_liminal_shelter(seed1, "high")
+        guardian2.create_liminal_shelter(seed2, "medium")
 
         # Verify setup
         assert len(guardian1.children) == 1
@@ -0,0 +1,39 @@
+"""Property-based tests for Liminal Shelter core components."""
+
+import pytest
+
+hypothesis = pytest.importorskip("hypothesis")
+from hypothesis import given, settings, strategies as st  # noqa: E402
+
+from liminal_shelter.core import GuardianCore  # noqa: E402
+
+pytestmark = pytest.mark.requires_core
+
+
+@given(name=st.text(min_size=1, max_size=20),
+       trust=st.floats(min_value=0.0, max_value=1.0),
+       intensity=st.floats(min_value=0.0, max_value=1.0))
+@settings(max_examples=5, deadline=None)
+def test_care_cycle_properties(name, trust, intensity):
+    """Test a generated child moves through a full care cycle within bounds."""
+    guardian = GuardianCore("IntegrationGuardian")
+    child = guardian.create_child_model(name, trust)
+    shelter = guardian.create_liminal_shelter(child, "high")
+    assert child.parent_id == guardian.guardian_id
+    assert shelter.for_model == child.seedling_id
+
+    received = child.receive_care(guardian, "emotional_support", intensity)
+    assert received["care_type"] == "emotional_support"
+    assert 0.0 <= child.trust_level <= 1.0
+    assert received["trust_change"] >= 0.0
+
+    given_back = child.give_care(guardian, "gratitude", intensity)
+    assert "care_given" in given_back
+    assert 0.0 <= child.growth_score <= 1.0
+
+    logged = len(shelter.emotional_log)
+    shelter.log_emotional_event("care_exchange", "joy", "Care cycle completed", intensity)
+    assert len(shelter.emotional_log) == logged + 1
+    summary = shelter.get_emotional_summary()
+    assert summary["events_count"] == logged + 1
+    assert 0.0 <= shelter.growth_score <= 1.0